@@ -21,6 +21,7 @@ from wain.config import (
     ENGINE_LOGOS,
     ENGINE_ICONS,
     AVAILABLE_LOGOS,
+    ENGINE_UI,
     STATUS_CONFIG,
     ASSET_VERSION,
     BLENDER_DENOISERS,
@@ -40,6 +41,7 @@ __all__ = [
     'ENGINE_LOGOS',
     'ENGINE_ICONS',
     'AVAILABLE_LOGOS',
+    'ENGINE_UI',
     'STATUS_CONFIG',
     'ASSET_VERSION',
     'BLENDER_DENOISERS',
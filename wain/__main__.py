@@ -102,6 +102,9 @@ def run():
     
     app.add_static_files('/logos', assets_dir)
     
+    # Job list writes are deferred; make sure the last change reaches disk
+    app.on_shutdown(lambda: render_app.flush_config(wait=True))
+    
     # Set window icon
     icon_ico = os.path.join(assets_dir, 'wain_icon.ico')
     icon_png = os.path.join(assets_dir, 'wain_logo.png')
@@ -8,17 +8,44 @@ Main application state and render queue management.
 import os
 import sys
 import json
+import queue
 import re
-import uuid
+import threading
+import time
+from collections import deque
+from functools import lru_cache, partial
+from operator import attrgetter
 from datetime import datetime
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional
 
 from nicegui import ui
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from wain.config import CONFIG_FILE, APP_VERSION
 from wain.models import RenderJob, AppSettings
 from wain.engines.registry import EngineRegistry
 
+def _dumps_config(data) -> str:
+    """Config JSON, indented; uses orjson's C encoder when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string keys in engine_settings; json copes with those
+    return json.dumps(data, indent=2)
+
+
+def _loads_config(text: str):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+# "Sample N/M" in engine status lines
+_SAMPLE_RE = re.compile(r'Sample (\d+)/(\d+)')
+
 
 def sanitize_to_ascii(message: str) -> str:
     if not message:
@@ -29,41 +56,131 @@ def sanitize_to_ascii(message: str) -> str:
         return "[encoding error]"
 
 
+@lru_cache(maxsize=4096)
+def _fmt_hms(total_secs: int) -> str:
+    """Elapsed seconds as H:MM:SS; the same second is formatted many times per render."""
+    h, rem = divmod(total_secs, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}"
+
+
+# Everything on a job card that on_progress can change; equal values show the same card
+_card_state = attrgetter("progress", "status_message", *RenderJob.DISPLAY_FIELDS)
+
+
+def render_progress_text(frames_display: str, samples_display: str, pass_display: str) -> str:
+    """The ' | pass | Frame x/y | samples' tail of a job card's info line."""
+    parts = []
+    if pass_display:
+        parts.append(pass_display)
+    if frames_display and '/' in frames_display:
+        parts.append(f"Frame {frames_display}")
+    if samples_display:
+        parts.append(samples_display)
+    return " | " + " | ".join(parts) if parts else ""
+
+
 class RenderApp:
     CONFIG_FILE = "wain_config.json"
+    # process_queue tick while something is rendering or waiting to start, and while idle
+    QUEUE_INTERVAL_ACTIVE = 0.25
+    QUEUE_INTERVAL_IDLE = 2.0
+    # Job list changes are written out at most this often (and on shutdown)
+    CONFIG_FLUSH_INTERVAL = 2.0
+    # How often process_queue re-reads the running job when its engine is quiet
+    LIVE_READ_INTERVAL = 0.5
     
     def __init__(self):
         self.engine_registry = EngineRegistry()
         self.settings = AppSettings()
+        # Display order (newest first) plus an id index for O(1) lookups
         self.jobs: List[RenderJob] = []
+        self._jobs_by_id: Dict[str, RenderJob] = {}
         self.current_job = None
+        # Engine running current_job, resolved once in start_render
+        self._current_engine = None
+        # time.monotonic() when the current render started or resumed
         self.render_start_time = None
-        self.log_messages: List[str] = []
+        # Oldest lines fall off in O(1) once the cap is reached
+        self.log_messages: Deque[str] = deque(maxlen=500)
         self.queue_container = None
         self.log_container = None
         self.stats_container = None
         self.job_count_container = None
+        self.queue_timer = None
         self._ui_needs_update = False
         self._render_finished = False
         self._log_needs_update = False
-        self._progress_updates = []
+        # Latest progress per job id, written by engine threads and drained by
+        # process_queue; item assignment and popitem() are atomic, so no update is lost
+        self._progress_updates: Dict[str, tuple] = {}
+        # job_id -> _card_state(job) when on_progress last queued an update
+        self._last_shown: Dict[str, tuple] = {}
+        # job_id -> last [progress, elapsed, render progress, status] sent to the browser
+        self._last_pushed = {}
+        # (job_id, render_start_time, accumulated_seconds) the browser's elapsed clock runs from
+        self._clock_key = None
+        # Ids of jobs waiting to start, next first; entries whose job was deleted or
+        # changed status are dropped when reached
+        self._queued_ids: Deque[str] = deque()
+        self._config_dirty = False
+        self._last_config_flush = 0.0
+        self._last_log_update = 0.0
+        self._last_live_read = 0.0
+        # Text of the config file as last read or written; identical saves are skipped
+        self._last_saved_text = None
+        # Guards _last_saved_text, which the writer thread resets when a write fails
+        self._saved_lock = threading.Lock()
+        # Pending config text for the writer thread; holds only the newest
+        self._write_q: queue.Queue = queue.Queue(maxsize=1)
+        self._writer: Optional[threading.Thread] = None
         self.load_config()
     
     def log(self, message: str):
         safe_message = sanitize_to_ascii(message)
         ts = datetime.now().strftime("%H:%M:%S")
         self.log_messages.append(f"[{ts}] {safe_message}")
-        if len(self.log_messages) > 100:
-            self.log_messages = self.log_messages[-100:]
-        self._log_needs_update = True
+        # Without a log view there is nothing to refresh; a new view reads the buffer when built
+        if self.log_container is not None:
+            self._log_needs_update = True
+    
+    def refresh_ui(self, jobs: bool = True, stats: bool = True, count: bool = True):
+        """Refresh each requested container once.
+
+        The containers are DebouncedRefresh wrappers, so calls from several
+        state changes in quick succession still rebuild each view only once.
+        """
+        for wanted, container in ((jobs, self.queue_container), (stats, self.stats_container), (count, self.job_count_container)):
+            if wanted and container:
+                # A page that is closing can't be rebuilt; the next page builds fresh
+                try: container.refresh()
+                except RuntimeError: pass
     
     def add_job(self, job):
         self.jobs.insert(0, job)
+        self._jobs_by_id[job.id] = job
+        if job.status == "queued":
+            # New jobs go ahead of those already waiting, matching the list order
+            self._queued_ids.appendleft(job.id)
         self.save_config()
         self.log(f"Added: {job.name}")
-        if self.queue_container: self.queue_container.refresh()
-        if self.stats_container: self.stats_container.refresh()
-        if self.job_count_container: self.job_count_container.refresh()
+        self.refresh_ui()
+        self.wake_queue()
+    
+    def resync_client(self):
+        """Forget what was pushed to the browser, so a freshly loaded page gets everything again."""
+        self._last_pushed.clear()
+        self._clock_key = None
+    
+    def get_job(self, job_id: str) -> Optional[RenderJob]:
+        return self._jobs_by_id.get(job_id)
+    
+    def wake_queue(self, job=None):
+        """Put `job` at the back of the queue, and start the next job now if nothing is rendering."""
+        if job is not None and job.id not in self._queued_ids:
+            self._queued_ids.append(job.id)
+        if self.current_job is None:
+            self.process_queue()
     
     def handle_action(self, action: str, job):
         import threading
@@ -75,8 +192,8 @@ class RenderApp:
         elif action == "pause":
             if self.current_job and self.current_job.id == job.id:
                 if self.render_start_time:
-                    job.accumulated_seconds += int((datetime.now() - self.render_start_time).total_seconds())
-                engine = self.engine_registry.get(job.engine_type)
+                    job.accumulated_seconds += int(time.monotonic() - self.render_start_time)
+                engine = self._current_engine
                 if engine:
                     # Run in background - pause_render is now non-blocking
                     if hasattr(engine, 'pause_render'):
@@ -84,6 +201,7 @@ class RenderApp:
                     else:
                         engine.cancel_render()
                 self.current_job = None
+                self._current_engine = None
                 self.render_start_time = None
             job.status = "paused"
         elif action == "retry":
@@ -104,90 +222,127 @@ class RenderApp:
                 job.progress = 0
         elif action == "delete":
             # Handle engine cleanup
-            engine = self.engine_registry.get(job.engine_type)
             if self.current_job and self.current_job.id == job.id:
-                if engine:
-                    engine.cancel_render()  # Non-blocking, closes Vantage
+                if self._current_engine:
+                    self._current_engine.cancel_render()  # Non-blocking, closes Vantage
                 self.current_job = None
+                self._current_engine = None
             elif job.status == "paused" and job.engine_type == "vantage":
                 # For paused Vantage jobs, close Vantage
+                engine = self.engine_registry.get(job.engine_type)
                 if engine:
                     engine.cancel_render()  # Non-blocking, closes Vantage
-            self.jobs = [j for j in self.jobs if j.id != job.id]
+            if self._jobs_by_id.pop(job.id, None) is not None:
+                for i, j in enumerate(self.jobs):
+                    if j.id == job.id:
+                        self.jobs.pop(i)
+                        break
+            try: self._queued_ids.remove(job.id)
+            except ValueError: pass
+            self._last_pushed.pop(job.id, None)
+            self._last_shown.pop(job.id, None)
         
         self.save_config()
-        if self.queue_container: self.queue_container.refresh()
-        if self.stats_container: self.stats_container.refresh()
-        if self.job_count_container: self.job_count_container.refresh()
+        self.refresh_ui()
+        if action in ("start", "retry"):
+            self.wake_queue(job)
     
     def process_queue(self):
-        now = datetime.now()
+        # Nothing rendering, waiting to start, or waiting to be shown or saved
+        if (self.current_job is None and not self._queued_ids and not self._progress_updates
+                and not self._ui_needs_update and not self._log_needs_update
+                and not self._config_dirty and self._clock_key is None):
+            if self.queue_timer is not None:
+                self.queue_timer.interval = self.QUEUE_INTERVAL_IDLE
+            return
+        
+        now = time.monotonic()
+        # Values to show per job; engine callbacks already keep only their latest update
+        latest = {}
+        
+        pending = self._progress_updates
+        while pending:
+            job_id, (progress, elapsed, frames_display, samples_display, pass_display, status_msg) = pending.popitem()
+            latest[job_id] = [progress, elapsed, render_progress_text(frames_display, samples_display, pass_display), status_msg or ""]
         
-        if self.current_job and self.current_job.status == "rendering" and self.render_start_time:
-            total_secs = self.current_job.accumulated_seconds + int((now - self.render_start_time).total_seconds())
-            h, rem = divmod(total_secs, 3600)
-            m, s = divmod(rem, 60)
-            elapsed = f"{h}:{m:02d}:{s:02d}"
-            self.current_job.elapsed_time = elapsed
+        job = self.current_job
+        if job and job.status == "rendering" and self.render_start_time:
+            total_secs = job.accumulated_seconds + int(now - self.render_start_time)
+            clock_key = (job.id, self.render_start_time, job.accumulated_seconds)
             
-            job = self.current_job
-            status_msg = job.status_message.replace('"', '\\"').replace("'", "\\'") if job.status_message else ""
-            try:
-                ui.run_javascript(f'window.updateJobProgress && window.updateJobProgress("{job.id}", {job.progress}, "{elapsed}", "{job.frames_display}", "{job.samples_display}", "{job.pass_display}", "{status_msg}");')
-            except:
-                pass
+            # Re-read the running job at ~2 Hz, or sooner when its engine reported something
+            if job.id in latest or now - self._last_live_read >= self.LIVE_READ_INTERVAL:
+                self._last_live_read = now
+                job.elapsed_time = _fmt_hms(total_secs)
+                # Read live from the job, so this supersedes anything queued for it.
+                # The browser ticks the elapsed time itself, so it is left out here.
+                latest[job.id] = [job.progress, "", render_progress_text(job.frames_display, job.samples_display, job.pass_display), job.status_message or ""]
+        else:
+            clock_key = None
         
-        if self._progress_updates:
-            updates = self._progress_updates.copy()
-            self._progress_updates.clear()
-            for update in updates:
-                try:
-                    job_id, progress, elapsed, frame, frames_display, samples_display, pass_display = update[:7]
-                    status_msg = update[7] if len(update) > 7 else ""
-                    status_msg = status_msg.replace('"', '\\"').replace("'", "\\'") if status_msg else ""
-                    ui.run_javascript(f'window.updateJobProgress && window.updateJobProgress("{job_id}", {progress}, "{elapsed}", "{frames_display}", "{samples_display}", "{pass_display}", "{status_msg}");')
-                except:
-                    pass
+        # Only jobs whose displayed values changed since the last push are sent
+        payload = []
+        for job_id, values in latest.items():
+            if self._last_pushed.get(job_id) != values:
+                self._last_pushed[job_id] = values
+                payload.append([job_id, *values])
+        
+        js = []
+        if payload:
+            js.append(f'window.wainApplyUpdates && window.wainApplyUpdates({json.dumps(payload)});')
+        # (Re)start the browser clock when a render starts or resumes, stop it when it ends
+        if clock_key != self._clock_key:
+            self._clock_key = clock_key
+            clock_args = f'{json.dumps(clock_key[0])}, {total_secs}' if clock_key else 'null, 0'
+            js.append(f'window.wainSetClock && window.wainSetClock({clock_args});')
+        
+        # All progress for this tick goes to the browser in one call
+        if js:
+            try:
+                ui.run_javascript(''.join(js))
+            except RuntimeError:
+                pass  # no page to send to; resync_client() catches up a new one
         
         if self._ui_needs_update and self._render_finished:
             self._ui_needs_update = False
             self._render_finished = False
-            if self.queue_container:
-                try: self.queue_container.refresh()
-                except: pass
-            if self.stats_container:
-                try: self.stats_container.refresh()
-                except: pass
-            if self.job_count_container:
-                try: self.job_count_container.refresh()
-                except: pass
+            self.refresh_ui()
         
         if self._log_needs_update:
             log_interval = 5.0 if self.current_job else 2.0
-            if not hasattr(self, '_last_log_update') or (now - self._last_log_update).total_seconds() >= log_interval:
+            if now - self._last_log_update >= log_interval:
                 self._log_needs_update = False
                 self._last_log_update = now
                 if self.log_container:
                     try: self.log_container.refresh()
-                    except: pass
+                    except RuntimeError: pass
         
-        if self.current_job is None:
-            for job in self.jobs:
-                if job.status == "queued":
-                    self.start_render(job)
-                    break
+        while self.current_job is None and self._queued_ids:
+            job = self.get_job(self._queued_ids.popleft())
+            if job is not None and job.status == "queued":
+                self.start_render(job)
+        
+        if self._config_dirty and now - self._last_config_flush >= self.CONFIG_FLUSH_INTERVAL:
+            self.flush_config()
+        
+        # Tick fast only while there is render work or pending UI updates
+        if self.queue_timer is not None:
+            busy = (self.current_job is not None or self._progress_updates or self._ui_needs_update
+                    or self._queued_ids)
+            self.queue_timer.interval = self.QUEUE_INTERVAL_ACTIVE if busy else self.QUEUE_INTERVAL_IDLE
     
     def start_render(self, job):
         engine = self.engine_registry.get(job.engine_type)
         if not engine:
             job.status = "failed"
             job.error_message = "Engine not found"
-            if self.queue_container: self.queue_container.refresh()
+            self.refresh_ui(stats=False, count=False)
             return
         
         self.current_job = job
+        self._current_engine = engine
         job.status = "rendering"
-        self.render_start_time = datetime.now()
+        self.render_start_time = time.monotonic()
         
         start_frame = job.frame_start
         if job.is_animation and job.current_frame > 0:
@@ -200,127 +355,162 @@ class RenderApp:
             initial_frame = start_frame - 1 if start_frame > 1 else 0
             job.progress = int((initial_frame / job.frame_end) * 100)
         
-        if self.queue_container: self.queue_container.refresh()
-        if self.stats_container: self.stats_container.refresh()
+        self.refresh_ui(count=False)
         self.log(f"Starting: {job.name}")
         
-        def on_progress(frame, msg):
-            total_secs = job.accumulated_seconds
-            if self.render_start_time:
-                total_secs += int((datetime.now() - self.render_start_time).total_seconds())
-            h, rem = divmod(total_secs, 3600)
-            m, s = divmod(rem, 60)
-            job.elapsed_time = f"{h}:{m:02d}:{s:02d}"
-            
-            # Store status message for UI display
-            job.status_message = msg if msg else ""
-            
-            sample_match = re.search(r'Sample (\d+)/(\d+)', msg)
-            if sample_match:
-                job.current_sample = int(sample_match.group(1))
-                job.total_samples = int(sample_match.group(2))
-            
-            # For Vantage: engine sets job properties directly, skip recalculation
-            # Just queue the UI update with current values
-            if job.engine_type == "vantage":
-                self._progress_updates.append((job.id, job.progress, job.elapsed_time, job.current_frame, job.frames_display, job.samples_display, job.pass_display, job.status_message))
-                return
-            
-            # For other engines (Blender, Marmoset): calculate progress from frame
-            if job.is_animation:
-                # CRITICAL: Only update rendering_frame if it's INCREASING
-                # Never go backwards - this prevents progress resets
-                if frame > 0 and frame > job.rendering_frame:
-                    job.rendering_frame = frame
-                if frame == -1 and job.rendering_frame > 0:
-                    job.current_frame = job.rendering_frame
-                    job.current_sample = 0
-                    new_progress = min(int((job.current_frame / job.frame_end) * 100), 99)
-                    # Only update if progress increases
-                    if new_progress > job.progress:
-                        job.progress = new_progress
-                elif job.rendering_frame > 0:
-                    completed_frames = job.rendering_frame - 1
-                    new_progress = min(int((completed_frames / job.frame_end) * 100), 99)
-                    # Only update if progress increases
-                    if new_progress > job.progress:
-                        job.progress = new_progress
-            else:
-                if frame == -1:
-                    job.progress = 99
-                elif sample_match:
-                    new_progress = min(int((job.current_sample / job.total_samples) * 100), 99)
-                    if new_progress > job.progress:
-                        job.progress = new_progress
-            
-            self._progress_updates.append((job.id, job.progress, job.elapsed_time, job.current_frame, job.frames_display, job.samples_display, job.pass_display, job.status_message))
+        self._last_shown.pop(job.id, None)
+        self._render_finished = False
+        # Bound methods with the job pre-applied, rather than fresh closures per render
+        engine.start_render(job, start_frame, partial(self._on_progress, job), partial(self._on_complete, job),
+                            partial(self._on_error, job), self.log)
+    
+    def _on_progress(self, job, frame, msg):
+        total_secs = job.accumulated_seconds
+        if self.render_start_time:
+            total_secs += int(time.monotonic() - self.render_start_time)
+        job.elapsed_time = _fmt_hms(total_secs)
         
-        def on_complete():
-            job.status = "completed"
-            job.progress = 100
-            self.current_job = None
-            self.log(f"Complete: {job.name}")
-            self.save_config()
-            self._ui_needs_update = True
-            self._render_finished = True
+        # Store status message for UI display
+        job.status_message = msg if msg else ""
         
-        def on_error(err):
-            job.status = "failed"
-            job.error_message = err
-            self.current_job = None
-            self.log(f"Failed: {job.name} - {err}")
-            self.save_config()
-            self._ui_needs_update = True
-            self._render_finished = True
+        # Substring check first; most lines carry no sample count
+        sample_match = _SAMPLE_RE.search(msg) if msg and 'Sample ' in msg else None
+        if sample_match:
+            job.current_sample = int(sample_match.group(1))
+            job.total_samples = int(sample_match.group(2))
         
-        self._render_finished = False
-        engine.start_render(job, start_frame, on_progress, on_complete, on_error, self.log)
+        # For Vantage: engine sets job properties directly, skip recalculation
+        # Just queue the UI update with current values
+        if job.engine_type == "vantage":
+            self._progress_updates[job.id] = (job.progress, job.elapsed_time, job.frames_display, job.samples_display, job.pass_display, job.status_message)
+            return
+        
+        # For other engines (Blender, Marmoset): calculate progress from frame
+        if job.is_animation:
+            # CRITICAL: Only update rendering_frame if it's INCREASING
+            # Never go backwards - this prevents progress resets
+            if frame > 0 and frame > job.rendering_frame:
+                job.rendering_frame = frame
+            if frame == -1 and job.rendering_frame > 0:
+                job.current_frame = job.rendering_frame
+                job.current_sample = 0
+                new_progress = min(job.current_frame * 100 // job.frame_end, 99)
+                # Only update if progress increases
+                if new_progress > job.progress:
+                    job.progress = new_progress
+            elif job.rendering_frame > 0:
+                completed_frames = job.rendering_frame - 1
+                new_progress = min(completed_frames * 100 // job.frame_end, 99)
+                # Only update if progress increases
+                if new_progress > job.progress:
+                    job.progress = new_progress
+        else:
+            if frame == -1:
+                job.progress = 99
+            elif sample_match:
+                new_progress = min(job.current_sample * 100 // job.total_samples, 99)
+                if new_progress > job.progress:
+                    job.progress = new_progress
+        
+        # Lines that change nothing on the card (e.g. repeated status text) queue nothing,
+        # and skip building the display strings
+        state = _card_state(job)
+        if self._last_shown.get(job.id) == state:
+            return
+        self._last_shown[job.id] = state
+        self._progress_updates[job.id] = (job.progress, job.elapsed_time, job.frames_display, job.samples_display, job.pass_display, job.status_message)
+    
+    def _on_complete(self, job):
+        job.status = "completed"
+        job.progress = 100
+        self.current_job = None
+        self._current_engine = None
+        self.log(f"Complete: {job.name}")
+        self.save_config()
+        self._ui_needs_update = True
+        self._render_finished = True
+    
+    def _on_error(self, job, err):
+        job.status = "failed"
+        job.error_message = err
+        self.current_job = None
+        self._current_engine = None
+        self.log(f"Failed: {job.name} - {err}")
+        self.save_config()
+        self._ui_needs_update = True
+        self._render_finished = True
     
     def save_config(self):
-        data = {"jobs": [{
-            "id": j.id, "name": j.name, "engine_type": j.engine_type,
-            "file_path": j.file_path, "output_folder": j.output_folder,
-            "output_name": j.output_name, "output_format": j.output_format,
-            "status": j.status if j.status != "rendering" else "paused",
-            "progress": j.progress, "is_animation": j.is_animation,
-            "frame_start": j.frame_start, "frame_end": j.frame_end,
-            "current_frame": j.current_frame, "rendering_frame": j.rendering_frame,
-            "original_start": j.original_start,
-            "res_width": j.res_width, "res_height": j.res_height,
-            "camera": j.camera, "overwrite_existing": j.overwrite_existing,
-            "engine_settings": j.engine_settings,
-            "elapsed_time": j.elapsed_time, "accumulated_seconds": j.accumulated_seconds,
-            "error_message": j.error_message,
-        } for j in self.jobs]}
-        try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-        except: pass
+        """Mark the job list as changed; process_queue writes it out shortly after."""
+        self._config_dirty = True
+    
+    def flush_config(self, wait: bool = False):
+        """Hand the job list to the writer thread if it changed; `wait` blocks until it is on disk."""
+        if self._config_dirty:
+            self._queue_config_write()
+        if wait and self._writer is not None:
+            self._write_q.join()
+    
+    def _queue_config_write(self):
+        self._config_dirty = False
+        self._last_config_flush = time.monotonic()
+        data = {"jobs": [j.to_dict() for j in self.jobs]}
+        text = _dumps_config(data)
+        with self._saved_lock:
+            if text == self._last_saved_text:
+                return
+            self._last_saved_text = text
+        
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name='config-writer', daemon=True)
+            self._writer.start()
+        # Latest wins: a write the thread hasn't picked up yet is replaced
+        while True:
+            try:
+                self._write_q.put_nowait(text)
+                return
+            except queue.Full:
+                try:
+                    self._write_q.get_nowait()
+                    self._write_q.task_done()
+                except queue.Empty:
+                    pass
+    
+    def _writer_loop(self):
+        while True:
+            text = self._write_q.get()
+            # Write a temp file and swap it in, so a crash mid-write keeps the old config
+            tmp_path = self.CONFIG_FILE + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    # On disk before the swap, or a power loss can leave an empty file in place
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.CONFIG_FILE)
+            except OSError as e:
+                # Let the next save retry instead of treating this text as written,
+                # unless newer text has been queued since
+                with self._saved_lock:
+                    if self._last_saved_text == text:
+                        self._last_saved_text = None
+                self.log(f"Could not save {self.CONFIG_FILE}: {e!r}")
+            finally:
+                self._write_q.task_done()
     
     def load_config(self):
         if os.path.exists(self.CONFIG_FILE):
             try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
+                with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                data = _loads_config(text)
+                self._last_saved_text = text
                 for jd in data.get("jobs", []):
-                    self.jobs.append(RenderJob(
-                        id=jd.get("id", str(uuid.uuid4())[:8]),
-                        name=jd.get("name", ""), engine_type=jd.get("engine_type", "blender"),
-                        file_path=jd.get("file_path", ""), output_folder=jd.get("output_folder", ""),
-                        output_name=jd.get("output_name", "render_"), output_format=jd.get("output_format", "PNG"),
-                        status=jd.get("status", "queued"), progress=jd.get("progress", 0),
-                        is_animation=jd.get("is_animation", False),
-                        frame_start=jd.get("frame_start", 1), frame_end=jd.get("frame_end", 250),
-                        current_frame=jd.get("current_frame", 0), rendering_frame=jd.get("rendering_frame", 0),
-                        original_start=jd.get("original_start", 0),
-                        res_width=jd.get("res_width", 1920), res_height=jd.get("res_height", 1080),
-                        camera=jd.get("camera", "Scene Default"),
-                        overwrite_existing=jd.get("overwrite_existing", True),
-                        engine_settings=jd.get("engine_settings", {}),
-                        elapsed_time=jd.get("elapsed_time", ""), accumulated_seconds=jd.get("accumulated_seconds", 0),
-                        error_message=jd.get("error_message", ""),
-                    ))
-            except: pass
+                    self.jobs.append(RenderJob.from_dict(jd))
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                self.log(f"Could not load {self.CONFIG_FILE}: {e!r}")
+            self._jobs_by_id = {j.id: j for j in self.jobs}
+            self._queued_ids = deque(j.id for j in self.jobs if j.status == "queued")
 
 
 render_app = RenderApp()
@@ -78,11 +78,29 @@ REQUIRED_ASSETS = [
 # Runtime-validated logos
 AVAILABLE_LOGOS = {}
 
+# Per-engine (logo_url, color, icon) for the UI; logo_url is None when the logo is missing.
+# Rebuilt by check_assets() so dialogs do one lookup per engine.
+ENGINE_UI = {}
+
+def _update_engine_ui():
+    ENGINE_UI.clear()
+    for engine_type in ENGINE_LOGOS.keys() | ENGINE_COLORS.keys() | ENGINE_ICONS.keys():
+        logo = AVAILABLE_LOGOS.get(engine_type)
+        logo_url = f'/logos/{logo}?{ASSET_VERSION}' if logo else None
+        ENGINE_UI[engine_type] = (
+            logo_url,
+            ENGINE_COLORS.get(engine_type, "#3f3f46"),
+            ENGINE_ICONS.get(engine_type, 'help'),
+        )
+
+_update_engine_ui()
+
 def check_assets(assets_dir: str):
-    """Check which asset files exist and update AVAILABLE_LOGOS."""
+    """Check which asset files exist and update AVAILABLE_LOGOS and ENGINE_UI."""
     AVAILABLE_LOGOS.clear()
     
     if not assets_dir or not os.path.isdir(assets_dir):
+        _update_engine_ui()
         return
     
     for engine, logo_file in ENGINE_LOGOS.items():
@@ -101,6 +119,8 @@ def check_assets(assets_dir: str):
             break
     else:
         print(f"  Missing: wain_logo.png")
+    
+    _update_engine_ui()
 
 # Blender denoiser options
 BLENDER_DENOISERS = {
@@ -7,7 +7,7 @@ Abstract base class for all render engines.
 
 import subprocess
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 
 class RenderEngine(ABC):
@@ -26,6 +26,8 @@ class RenderEngine(ABC):
     
     def __init__(self):
         self.installed_versions: Dict[str, str] = {}
+        self._sorted_versions: List[Tuple[str, str]] = []
+        self.versions_revision = 0
         self.current_process: Optional[subprocess.Popen] = None
         self.is_cancelling = False
     
@@ -36,7 +38,11 @@ class RenderEngine(ABC):
     
     @abstractmethod
     def get_scene_info(self, file_path: str) -> Dict[str, Any]:
-        """Probe a scene file and return information about it."""
+        """Probe a scene file and return information about it.
+
+        Set "probed": True only when the values were read from the scene; the
+        defaults returned on failure are not cached.
+        """
         pass
     
     @abstractmethod
@@ -73,12 +79,21 @@ class RenderEngine(ABC):
         """Check if this engine is available."""
         return len(self.installed_versions) > 0
     
+    @property
+    def sorted_versions(self) -> List[Tuple[str, str]]:
+        """Installed (version, path) pairs, newest first. Kept in sync by versions_changed()."""
+        return self._sorted_versions
+    
+    def versions_changed(self):
+        """Re-sort the installed versions; call after installed_versions is modified."""
+        self._sorted_versions = sorted(self.installed_versions.items(), reverse=True)
+        self.versions_revision += 1
+    
     @property
     def version_display(self) -> str:
         """Get display string for installed version(s)."""
         if self.installed_versions:
-            newest = sorted(self.installed_versions.keys(), reverse=True)[0]
-            return f"{self.name} {newest}"
+            return f"{self.name} {self.sorted_versions[0][0]}"
         return f"{self.name} not detected"
     
     def open_file_in_app(self, file_path: str, version: str = None):
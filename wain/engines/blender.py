@@ -52,6 +52,7 @@ class BlenderEngine(RenderEngine):
                 version = self._get_version_from_exe(exe_path)
                 if version:
                     self.installed_versions[version] = exe_path
+        self.versions_changed()
     
     def _get_version_from_exe(self, exe_path: str) -> Optional[str]:
         try:
@@ -71,13 +72,13 @@ class BlenderEngine(RenderEngine):
             version = self._get_version_from_exe(path)
             if version:
                 self.installed_versions[version] = path
+                self.versions_changed()
                 return version
         return None
     
     def get_best_blender_for_file(self, blend_path: str) -> Optional[str]:
         if self.installed_versions:
-            versions = sorted(self.installed_versions.keys(), reverse=True)
-            return self.installed_versions[versions[0]]
+            return self.sorted_versions[0][1]
         return None
     
     def get_scene_info(self, file_path: str) -> Dict[str, Any]:
@@ -171,6 +172,8 @@ print("INFO_END")
                     elif line.startswith('HAS_COMPOSITOR_DENOISE:'): info["has_compositor_denoise"] = line.split(':')[1] == 'True'
             
             if cameras: info["cameras"] = ["Scene Default"] + cameras
+            # Without the markers Blender failed before the script ran; these are just defaults
+            info["probed"] = 'INFO_START' in stdout
             return info
         except Exception as e:
             print(f"[Wain] Error probing Blender scene: {e}")
@@ -50,18 +50,20 @@ class MarmosetEngine(RenderEngine):
             if os.path.isfile(path):
                 version = "5.0" if "Toolbag 5" in path else "4.0" if "Toolbag 4" in path else "Unknown"
                 self.installed_versions[version] = path
+        self.versions_changed()
     
     def add_custom_path(self, path: str) -> Optional[str]:
         if os.path.isfile(path) and path.lower().endswith('.exe'):
             version = "Custom"
             self.installed_versions[version] = path
+            self.versions_changed()
             return version
         return None
     
     def get_best_toolbag(self) -> Optional[str]:
         if not self.installed_versions:
             return None
-        return self.installed_versions[sorted(self.installed_versions.keys(), reverse=True)[0]]
+        return self.sorted_versions[0][1]
     
     def get_output_formats(self) -> Dict[str, str]:
         return self.OUTPUT_FORMATS
@@ -19,12 +19,24 @@ class EngineRegistry:
     
     def __init__(self):
         self.engines: Dict[str, RenderEngine] = {}
+        # Cached lookups; reset on register(), available list also tracks version scans
+        self._available: Optional[List[RenderEngine]] = None
+        self._available_key: Optional[tuple] = None
+        self._file_filters: Optional[List[tuple]] = None
+        self._by_extension: Dict[str, RenderEngine] = {}
         self.register(BlenderEngine())
         self.register(MarmosetEngine())
         self.register(VantageEngine())
     
     def register(self, engine: RenderEngine):
         self.engines[engine.engine_type] = engine
+        self._available = None
+        self._file_filters = None
+        # First registered engine wins an extension, matching the old linear scan
+        self._by_extension = {}
+        for e in self.engines.values():
+            for ext in e.file_extensions:
+                self._by_extension.setdefault(ext, e)
     
     def get(self, engine_type: str) -> Optional[RenderEngine]:
         return self.engines.get(engine_type)
@@ -33,16 +45,18 @@ class EngineRegistry:
         return list(self.engines.values())
     
     def get_available(self) -> List[RenderEngine]:
-        return [e for e in self.engines.values() if e.is_available]
+        key = tuple(e.versions_revision for e in self.engines.values())
+        if self._available is None or key != self._available_key:
+            self._available = [e for e in self.engines.values() if e.is_available]
+            self._available_key = key
+        return self._available
     
     def detect_engine_for_file(self, file_path: str) -> Optional[RenderEngine]:
-        ext = os.path.splitext(file_path)[1].lower()
-        for engine in self.engines.values():
-            if ext in engine.file_extensions:
-                return engine
-        return None
+        return self._by_extension.get(os.path.splitext(file_path)[1].lower())
     
     def get_all_file_filters(self) -> List[tuple]:
+        if self._file_filters is not None:
+            return self._file_filters
         filters = []
         all_exts = []
         for engine in self.engines.values():
@@ -51,4 +65,5 @@ class EngineRegistry:
             filters.extend(engine.get_file_dialog_filter())
         filters.insert(0, ("All Supported Files", " ".join(all_exts)))
         filters.append(("All Files", "*.*"))
+        self._file_filters = filters
         return filters
@@ -376,11 +376,13 @@ class VantageEngine(RenderEngine):
             if os.path.isfile(path):
                 version = "3.x" if "Vantage 3" in path else "2.x" if "Vantage 2" in path else "Unknown"
                 self.installed_versions[version] = path
+        self.versions_changed()
     
     def add_custom_path(self, path: str) -> Optional[str]:
         """Add a custom Vantage path."""
         if os.path.isfile(path) and path.lower().endswith('.exe'):
             self.installed_versions["Custom"] = path
+            self.versions_changed()
             return "Custom"
         return None
     
@@ -442,9 +444,13 @@ class VantageEngine(RenderEngine):
             "camera_resolutions": {},
         }
         
+        # Only a clean read of both sources counts as a successful probe
+        probed = False
+        
         # =====================================================================
         # PART 1: Read HQ settings from vantage.ini
         # =====================================================================
+        ini_ok = True
         try:
             settings = read_vantage_settings()
             if settings:
@@ -460,6 +466,7 @@ class VantageEngine(RenderEngine):
                 
                 print(f"[Wain] INI settings: {settings.width}x{settings.height}, {settings.samples} samples, denoiser={info['denoiser_name']}")
         except Exception as e:
+            ini_ok = False
             print(f"[Wain] Could not read vantage.ini: {e}")
         
         # =====================================================================
@@ -517,11 +524,13 @@ class VantageEngine(RenderEngine):
                     info["has_animation"] = total_frames > 1
                     print(f"[Wain] Animation: {max_duration}s @ {fps}fps = {total_frames} frames")
                 
+                probed = ini_ok
             except json.JSONDecodeError as e:
                 print(f"[Wain] Could not parse .vantage file: {e}")
             except Exception as e:
                 print(f"[Wain] Error reading .vantage file: {e}")
         
+        info["probed"] = probed
         return info
     
     # =========================================================================
@@ -8,12 +8,17 @@ Core data structures for render jobs and application settings.
 import os
 import uuid
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderJob:
-    """Represents a single render job in the queue."""
+    """Represents a single render job in the queue.
+
+    Slotted: the queue can hold hundreds of these and the engine threads
+    update them on every progress line.
+    """
     
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
     name: str = ""
@@ -51,6 +56,33 @@ class RenderJob:
     pass_frame: int = 0
     pass_total_frames: int = 0
     
+    # Fields written to the config file, in file order
+    SAVED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "id", "name", "engine_type", "file_path", "output_folder",
+        "output_name", "output_format", "status", "progress", "is_animation",
+        "frame_start", "frame_end", "current_frame", "rendering_frame",
+        "original_start", "res_width", "res_height", "camera", "overwrite_existing",
+        "engine_settings", "elapsed_time", "accumulated_seconds", "error_message",
+    )
+    # Every field the *_display properties below read; keep in step with them
+    DISPLAY_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "engine_type", "is_animation", "frame_start", "frame_end", "current_frame",
+        "rendering_frame", "current_sample", "total_samples", "current_tile", "total_tiles",
+        "current_pass", "current_pass_num", "total_passes", "pass_frame", "pass_total_frames",
+    )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """The saved fields as a dict; a render in progress is saved as paused."""
+        data = dict(zip(self.SAVED_FIELDS, _saved_values(self)))
+        if data["status"] == "rendering":
+            data["status"] = "paused"
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RenderJob":
+        """Inverse of to_dict; missing fields take their defaults."""
+        return cls(**{k: data[k] for k in cls.SAVED_FIELDS if k in data})
+    
     @property
     def samples_display(self) -> str:
         if self.engine_type == "marmoset":
@@ -128,6 +160,9 @@ class RenderJob:
         return self.engine_settings.get(key, default)
 
 
+_saved_values = attrgetter(*RenderJob.SAVED_FIELDS)
+
+
 @dataclass
 class AppSettings:
     """Application-wide settings."""
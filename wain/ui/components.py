@@ -53,7 +53,7 @@ def create_job_card(job):
     engine_logo = AVAILABLE_LOGOS.get(job.engine_type)
     engine_icon = ENGINE_ICONS.get(job.engine_type, "help")
     
-    with ui.card().classes('w-full'):
+    with ui.card().classes('job-card'):
         with ui.row().classes('w-full items-center gap-3'):
             if engine_logo:
                 ui.image(f'/logos/{engine_logo}?{ASSET_VERSION}').classes('w-8 h-8 object-contain')
@@ -99,16 +99,15 @@ def create_job_card(job):
             ui.html(f'''
                 <div class="custom-progress-container {status_class} {engine_class}">
                     <div class="custom-progress-track">
-                        <div class="custom-progress-fill" id="progress-fill-{job.id}" data-target="{progress_width}" style="width: {progress_width}%;"></div>
+                        <div class="custom-progress-fill" id="progress-fill-{job.id}" data-target="{progress_width}" style="transform: scaleX({progress_width / 100});"></div>
                     </div>
                     <div class="custom-progress-label" id="progress-label-{job.id}">{job.progress}%</div>
                 </div>
             ''', sanitize=False).classes('w-full mt-2')
         
         engine_name = engine.name if engine else job.engine_type
-        info_parts = [engine_name, job.resolution_display]
-        if job.elapsed_time:
-            info_parts.append(f"Time: {job.elapsed_time}")
+        info_text = f"{engine_name} | {job.resolution_display}"
+        time_text = f" | Time: {job.elapsed_time}" if job.elapsed_time else ""
         
         progress_parts = []
         if job.total_passes > 1 and job.current_pass:
@@ -121,9 +120,10 @@ def create_job_card(job):
         
         render_progress = " | ".join(progress_parts)
         
+        # Time and render progress live in fixed spans so live updates only set their text
         ui.html(f'''
             <div id="job-info-{job.id}" class="text-sm text-gray-500 mt-2">
-                {" | ".join(info_parts)}<span id="job-render-progress-{job.id}">{(" | " + render_progress) if render_progress else ""}</span>
+                {info_text}<span id="job-time-{job.id}">{time_text}</span><span id="job-render-progress-{job.id}">{(" | " + render_progress) if render_progress else ""}</span>
             </div>
         ''', sanitize=False)
         
@@ -8,14 +8,57 @@ v2.15.14 - Simplified Vantage (just load and render)
 
 import os
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Optional, Dict, Any
 
 from nicegui import ui
 
-from wain.config import ENGINE_COLORS, AVAILABLE_LOGOS, ENGINE_ICONS, ASSET_VERSION, BLENDER_DENOISER_FROM_INTERNAL
+from wain.config import ENGINE_COLORS, ENGINE_UI, AVAILABLE_LOGOS, ENGINE_ICONS, ASSET_VERSION, BLENDER_DENOISER_FROM_INTERNAL
 from wain.models import RenderJob
 from wain.app import render_app
 from wain.utils.file_dialogs import open_file_dialog_async, open_folder_dialog_async
+from wain.utils.debounce import Debouncer
+
+# Option lists for the engine settings section, built once instead of per refresh
+MARMOSET_RENDER_TYPES = ['still', 'turntable', 'animation']
+VANTAGE_DENOISER_OPTIONS = [
+    {'label': 'NVIDIA OptiX AI', 'value': 'nvidia'},
+    {'label': 'Intel OIDN', 'value': 'oidn'},
+    {'label': 'Off', 'value': 'off'},
+]
+
+# (settings key, form key, cast) copied into a new job's engine_settings on submit.
+# The add form always seeds these keys. Vantage fields only apply with custom settings on.
+_ENGINE_SETTINGS_FIELDS = {
+    'marmoset': (('render_type', 'render_type', None), ('samples', 'samples', int), ('render_passes', 'render_passes', list)),
+    'vantage': (('samples', 'vantage_samples', int), ('denoiser', 'vantage_denoiser', None)),
+}
+
+# Editable job fields that show up on the queue card
+_card_fields = attrgetter('name', 'file_path', 'output_folder', 'res_width', 'res_height', 'is_animation', 'frame_end')
+# Every job field apply_form_to_job can change
+_edited_fields = attrgetter('name', 'file_path', 'output_folder', 'output_name', 'output_format', 'res_width',
+                            'res_height', 'is_animation', 'frame_start', 'frame_end', 'overwrite_existing', 'engine_settings')
+
+# Engine button and accent styles, formatted once per engine color
+_BTN_STYLE_UNSELECTED = 'background-color: transparent !important; color: #52525b !important;'
+_BTN_STYLE_SELECTED = {et: f'background-color: {c} !important; color: white !important;' for et, c in ENGINE_COLORS.items()}
+_BTN_STYLE_SELECTED_DEFAULT = 'background-color: #71717a !important; color: white !important;'
+_ACCENT_STYLE = {et: f'background-color: {c} !important;' for et, c in ENGINE_COLORS.items()}
+_ACCENT_STYLE_DEFAULT = 'background-color: #71717a !important;'
+
+# Resolution presets offered under the width/height inputs
+_RES_SCALES = [(0.25, '25%'), (0.5, '50%'), (1.0, '100%'), (1.5, '150%'), (2.0, '200%')]
+
+# Shared layout classes, reused by every dialog build
+_CLS_ROW = 'w-full items-center gap-2'
+_CLS_HEADER = 'w-full items-center justify-between p-4'
+_CLS_FOOTER = 'w-full justify-end gap-2 p-4 border-t border-zinc-700'
+_CLS_FIELD_LABEL = 'text-gray-400 w-20'
+_CLS_SECTION_LABEL = 'text-sm text-gray-400'
+_CLS_HINT = 'text-xs text-zinc-400'
 
 
 def _normalize_denoiser_value(value: str) -> str:
@@ -30,29 +73,113 @@ def _normalize_denoiser_value(value: str) -> str:
     return 'OpenImageDenoise'
 
 
+def apply_form_to_job(job: RenderJob, form: Dict[str, Any]):
+    """Copy the edit dialog's form values onto a job."""
+    # ui.number hands back floats
+    res_width = int(form['res_width'])
+    res_height = int(form['res_height'])
+    
+    job.name = form['name'] or "Untitled"
+    job.file_path = form['file_path']
+    job.output_folder = form['output_folder']
+    job.output_name = form['output_name']
+    job.output_format = form['output_format']
+    job.res_width = res_width
+    job.res_height = res_height
+    job.is_animation = form['is_animation']
+    job.frame_start = int(form['frame_start'])
+    job.frame_end = int(form['frame_end'])
+    job.overwrite_existing = form['overwrite_existing']
+    
+    # Vantage custom settings carry their own copy of the resolution; only
+    # replace the settings dict when it actually differs
+    settings = job.engine_settings
+    if settings.get('use_custom_settings') and (settings.get('width'), settings.get('height')) != (res_width, res_height):
+        job.engine_settings = {**settings, 'width': res_width, 'height': res_height}
+
+
+# Scene probes can launch the host app for seconds; keep them off the default
+# executor and remember successful results per (engine, path, mtime)
+_probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scene-probe')
+_probe_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_PROBE_CACHE_SIZE = 64
+
+
+async def _probe_scene_info(engine, file_path: str) -> Dict[str, Any]:
+    try:
+        key = (engine.engine_type, file_path, os.path.getmtime(file_path))
+    except OSError:
+        key = None
+    if key in _probe_cache:
+        _probe_cache.move_to_end(key)
+        return _probe_cache[key]
+    
+    loop = asyncio.get_running_loop()
+    info = await loop.run_in_executor(_probe_executor, engine.get_scene_info, file_path)
+    # A failed probe returns the engine's defaults; don't let that stick until the file changes
+    if key is not None and info.get('probed'):
+        _probe_cache[key] = info
+        if len(_probe_cache) > _PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+    return info
+
+
+# Last built dialogs, reused while the state they show is unchanged
+_settings_dialog_cache = {'sig': None, 'client': None, 'dialog': None, 'reset': None}
+_edit_dialog_cache = {'sig': None, 'client': None, 'dialog': None, 'reset': None}
+_add_job_dialog_cache = {'sig': None, 'client': None, 'dialog': None, 'reset': None}
+
+
+def _reopen_cached_dialog(cache: dict, sig) -> bool:
+    """Reopen the cached dialog if it belongs to this client and still matches sig."""
+    cached = cache['dialog']
+    if cached is None or cached.is_deleted or cache['client'] is not ui.context.client:
+        return False
+    if cache['sig'] == sig:
+        if cache['reset']:
+            cache['reset']()
+        cached.open()
+        return True
+    cached.delete()
+    return False
+
+
+def _cache_dialog(cache: dict, sig, dialog, reset=None):
+    """Remember a built dialog; reset() runs before each reuse."""
+    cache.update(sig=sig, client=ui.context.client, dialog=dialog, reset=reset)
+
+
+# Starting values for the Add Job form; copied on every open
+_ADD_JOB_DEFAULTS = {
+    'engine_type': 'blender', 'name': '', 'file_path': '', 'output_folder': '',
+    'output_name': 'render_', 'output_format': 'PNG', 'camera': 'Scene Default',
+    'is_animation': False, 'frame_start': 1, 'frame_end': 250,
+    'res_width': 1920, 'res_height': 1080, 'base_res_width': 1920, 'base_res_height': 1080,
+    'submit_paused': False, 'overwrite_existing': True,
+    # Marmoset-specific
+    'render_type': 'still', 'samples': 256, 'render_passes': ['beauty'],
+    # Blender-specific
+    'blender_denoiser': 'OptiX',
+    # Vantage-specific
+    'vantage_use_custom': False,  # Toggle for custom settings
+    'vantage_samples': 100,
+    'vantage_denoiser': 'nvidia',  # nvidia, oidn, off
+}
+
+
 async def show_add_job_dialog():
     """Add Job dialog with all fields visible."""
+    # The engine buttons depend on which engines are installed
+    sig = tuple(e.engine_type for e in render_app.engine_registry.get_available())
+    if _reopen_cached_dialog(_add_job_dialog_cache, sig):
+        return
     
-    form = {
-        'engine_type': 'blender', 'name': '', 'file_path': '', 'output_folder': '',
-        'output_name': 'render_', 'output_format': 'PNG', 'camera': 'Scene Default',
-        'is_animation': False, 'frame_start': 1, 'frame_end': 250,
-        'res_width': 1920, 'res_height': 1080, 'base_res_width': 1920, 'base_res_height': 1080,
-        'submit_paused': False, 'overwrite_existing': True,
-        # Marmoset-specific
-        'render_type': 'still', 'samples': 256, 'render_passes': ['beauty'],
-        # Blender-specific
-        'blender_denoiser': 'OptiX',
-        # Vantage-specific
-        'vantage_use_custom': False,  # Toggle for custom settings
-        'vantage_samples': 100,
-        'vantage_denoiser': 'nvidia',  # nvidia, oidn, off
-    }
+    form = {**_ADD_JOB_DEFAULTS, 'render_passes': list(_ADD_JOB_DEFAULTS['render_passes'])}
     
     camera_select = None
     res_w_input = None
     res_h_input = None
-    res_scale_container = None
+    scale_refresh = None
     frame_start_input = None
     frame_end_input = None
     anim_checkbox = None
@@ -60,15 +187,18 @@ async def show_add_job_dialog():
     output_input = None
     name_input = None
     engine_buttons = {}
-    accent_elements = {}
+    submit_btn = None
+    update_engine_visibility = None
+    # Bumped by every probe and by reset_form; a probe that finds it changed drops its result
+    probe_generation = 0
     
     def get_current_scale():
         if form['base_res_width'] > 0 and form['base_res_height'] > 0:
-            return form['res_width'] / form['base_res_width']
+            return (form['res_width'] or 0) / form['base_res_width']
         return 1.0
     
     def apply_scale(scale: float):
-        nonlocal res_w_input, res_h_input, res_scale_container
+        nonlocal res_w_input, res_h_input
         new_w = max(1, int(form['base_res_width'] * scale))
         new_h = max(1, int(form['base_res_height'] * scale))
         form['res_width'] = new_w
@@ -77,63 +207,63 @@ async def show_add_job_dialog():
             res_w_input.value = new_w
         if res_h_input:
             res_h_input.value = new_h
-        if res_scale_container:
-            res_scale_container.refresh()
+        if scale_refresh:
+            scale_refresh.schedule()
     
     def select_engine(eng_type):
+        prev_type = form['engine_type']
+        if eng_type == prev_type:
+            return
         form['engine_type'] = eng_type
-        accent_color = ENGINE_COLORS.get(eng_type, "#71717a")
         
-        for et, btn in engine_buttons.items():
-            if et == eng_type:
-                btn.style(f'background-color: {ENGINE_COLORS.get(et, "#71717a")} !important; color: white !important;')
-            else:
-                btn.style('background-color: transparent !important; color: #52525b !important;')
+        # Only the previously selected and the newly selected buttons change
+        if prev_type in engine_buttons:
+            engine_buttons[prev_type].style(_BTN_STYLE_UNSELECTED)
+        if eng_type in engine_buttons:
+            engine_buttons[eng_type].style(_BTN_STYLE_SELECTED.get(eng_type, _BTN_STYLE_SELECTED_DEFAULT))
         
-        if 'submit_btn' in accent_elements:
-            accent_elements['submit_btn'].style(f'background-color: {accent_color} !important;')
-        if 'engine_settings' in accent_elements:
-            accent_elements['engine_settings'].refresh()
+        if submit_btn:
+            submit_btn.style(_ACCENT_STYLE.get(eng_type, _ACCENT_STYLE_DEFAULT))
+        if update_engine_visibility:
+            update_engine_visibility()
     
     with ui.dialog() as dialog, ui.card().style('width: 600px; max-width: 95vw; padding: 0;'):
-        with ui.row().classes('w-full items-center justify-between p-4'):
+        with ui.row().classes(_CLS_HEADER):
             ui.label('Add Render Job').classes('text-lg font-bold')
             ui.button(icon='close', on_click=dialog.close).props('flat round dense size=sm')
         
         with ui.column().classes('w-full p-4 gap-3').style('max-height: 70vh; overflow-y: auto;'):
-            with ui.row().classes('w-full items-center gap-2'):
-                ui.label('Engine:').classes('text-gray-400 w-20')
+            with ui.row().classes(_CLS_ROW):
+                ui.label('Engine:').classes(_CLS_FIELD_LABEL)
                 with ui.row().classes('gap-2'):
                     for engine in render_app.engine_registry.get_available():
-                        engine_logo = AVAILABLE_LOGOS.get(engine.engine_type)
-                        is_selected = engine.engine_type == form['engine_type']
                         eng_type = engine.engine_type
-                        accent_color = ENGINE_COLORS.get(eng_type, "#71717a")
-                        
-                        if is_selected:
-                            btn_style = f'background-color: {accent_color} !important; color: white !important;'
+                        logo_url, _, engine_icon = ENGINE_UI.get(eng_type, (None, "#71717a", 'help'))
+                        if eng_type == form['engine_type']:
+                            btn_style = _BTN_STYLE_SELECTED.get(eng_type, _BTN_STYLE_SELECTED_DEFAULT)
                         else:
-                            btn_style = 'background-color: transparent !important; color: #52525b !important;'
+                            btn_style = _BTN_STYLE_UNSELECTED
                         
                         with ui.button(on_click=lambda et=eng_type: select_engine(et)).props('flat dense').style(btn_style) as btn:
                             with ui.row().classes('items-center gap-2'):
-                                if engine_logo:
-                                    ui.image(f'/logos/{engine_logo}?{ASSET_VERSION}').classes('w-5 h-5 object-contain')
+                                if logo_url:
+                                    ui.image(logo_url).classes('w-5 h-5 object-contain')
                                 else:
-                                    ui.icon(ENGINE_ICONS.get(eng_type, 'help')).classes('text-lg')
+                                    ui.icon(engine_icon).classes('text-lg')
                                 ui.label(engine.name).classes('text-sm')
-                        engine_buttons[engine.engine_type] = btn
+                        engine_buttons[eng_type] = btn
             
             name_input = ui.input('Job Name', placeholder='Enter job name').classes('w-full')
             name_input.bind_value(form, 'name')
             
-            ui.label('Scene File:').classes('text-sm text-gray-400')
+            ui.label('Scene File:').classes(_CLS_SECTION_LABEL)
             with ui.row().classes('w-full gap-2 items-center'):
                 file_input = ui.input(placeholder=r'C:\path\to\scene').classes('flex-grow')
                 file_input.bind_value(form, 'file_path')
                 
                 def probe_scene(file_path: str):
                     nonlocal camera_select, res_w_input, res_h_input, frame_start_input, frame_end_input, anim_checkbox
+                    nonlocal probe_generation
                     detected = render_app.engine_registry.detect_engine_for_file(file_path)
                     if not detected:
                         status_label.set_text('Unknown file type')
@@ -142,11 +272,14 @@ async def show_add_job_dialog():
                     select_engine(detected.engine_type)
                     status_label.set_text('Probing scene...')
                     status_label.classes(replace='text-xs text-yellow-500')
+                    probe_generation += 1
+                    generation = probe_generation
                     
                     async def do_probe_async():
                         nonlocal camera_select, res_w_input, res_h_input, frame_start_input, frame_end_input, anim_checkbox
-                        loop = asyncio.get_event_loop()
-                        info = await loop.run_in_executor(None, lambda: detected.get_scene_info(file_path))
+                        info = await _probe_scene_info(detected, file_path)
+                        if generation != probe_generation:
+                            return  # the form was reset or another scene probed meanwhile
                         
                         # Update resolution (ALL engines including Vantage)
                         if info.get('resolution_x') and res_w_input:
@@ -157,24 +290,23 @@ async def show_add_job_dialog():
                             res_h_input.value = info['resolution_y']
                             form['res_height'] = info['resolution_y']
                             form['base_res_height'] = info['resolution_y']
-                        if res_scale_container:
-                            res_scale_container.refresh()
+                        if scale_refresh:
+                            scale_refresh.schedule()
                         
                         # Update cameras (NOW INCLUDING VANTAGE - parsed from .vantage file)
                         if camera_select is not None:
                             cameras = info.get('cameras', [])
+                            # set_options swaps options and value in one element update
                             if cameras:
-                                camera_select.options = cameras
                                 active_cam = info.get('active_camera', cameras[0])
                                 if active_cam in cameras:
-                                    camera_select.value = active_cam
+                                    camera_select.set_options(cameras, value=active_cam)
                                     form['camera'] = active_cam
-                                camera_select.update()
+                                else:
+                                    camera_select.set_options(cameras)
                             elif detected.engine_type != 'vantage':
                                 # Non-Vantage: default to Scene Default
-                                camera_select.options = ['Scene Default']
-                                camera_select.value = 'Scene Default'
-                                camera_select.update()
+                                camera_select.set_options(['Scene Default'], value='Scene Default')
                         
                         # Update frame range (NOW INCLUDING VANTAGE - parsed from .vantage file)
                         if info.get('frame_start') and frame_start_input:
@@ -203,9 +335,10 @@ async def show_add_job_dialog():
                             if info.get('animation_fps'):
                                 form['vantage_fps'] = info['animation_fps']
                         
-                        # Update engine settings section
-                        if 'engine_settings' in accent_elements:
-                            accent_elements['engine_settings'].refresh()
+                        # Settings widgets are bound to the form; only the custom
+                        # Vantage block shows a static copy of the resolution
+                        if detected.engine_type == 'vantage' and form['vantage_use_custom']:
+                            vantage_custom_settings.refresh()
                         
                         # Status message
                         if detected.engine_type == 'vantage':
@@ -223,33 +356,35 @@ async def show_add_job_dialog():
                     
                     asyncio.create_task(do_probe_async())
                 
+                # Picker callbacks are defined once per dialog build, not per click
+                def on_file_selected(result):
+                    if result:
+                        file_input.value = result
+                        if not form['name']:
+                            name_input.value = os.path.splitext(os.path.basename(result))[0]
+                        if not form['output_folder']:
+                            output_input.value = os.path.dirname(result)
+                        probe_scene(result)
+                
                 def browse_file():
-                    def on_file_selected(result):
-                        if result:
-                            file_input.value = result
-                            if not form['name']:
-                                name_input.value = os.path.splitext(os.path.basename(result))[0]
-                            if not form['output_folder']:
-                                output_input.value = os.path.dirname(result)
-                            probe_scene(result)
-                    
                     filters = render_app.engine_registry.get_all_file_filters()
                     open_file_dialog_async("Select Scene File", filters, None, on_file_selected)
                 
                 ui.button('Browse', icon='folder_open', on_click=browse_file).props('flat dense')
             
-            with ui.row().classes('w-full items-center gap-2'):
+            with ui.row().classes(_CLS_ROW):
                 status_label = ui.label('Select a scene file to load settings').classes('text-xs text-gray-500 flex-grow')
             
-            ui.label('Output Folder:').classes('text-sm text-gray-400')
+            ui.label('Output Folder:').classes(_CLS_SECTION_LABEL)
             with ui.row().classes('w-full gap-2 items-center'):
                 output_input = ui.input(placeholder=r'C:\path\to\output').classes('flex-grow')
                 output_input.bind_value(form, 'output_folder')
                 
+                def on_folder_selected(result):
+                    if result:
+                        output_input.value = result
+                
                 def browse_output():
-                    def on_folder_selected(result):
-                        if result:
-                            output_input.value = result
                     open_folder_dialog_async("Select Output Folder", None, on_folder_selected)
                 
                 ui.button('Browse', icon='folder_open', on_click=browse_output).props('flat dense')
@@ -259,28 +394,44 @@ async def show_add_job_dialog():
                 ui.select(['PNG', 'JPEG', 'OpenEXR', 'TIFF'], value='PNG', label='Format').bind_value(form, 'output_format').classes('w-28')
             
             # Resolution (always visible but only used by non-Vantage engines)
-            ui.label('Resolution:').classes('text-sm text-gray-400')
-            with ui.row().classes('w-full items-center gap-2'):
-                res_w_input = ui.number('Width', value=1920, min=1).classes('w-24')
+            ui.label('Resolution:').classes(_CLS_SECTION_LABEL)
+            with ui.row().classes(_CLS_ROW):
+                res_w_input = ui.number('Width', value=1920, min=1, on_change=lambda: on_resolution_change()).classes('w-24')
                 res_w_input.bind_value(form, 'res_width')
                 ui.label('x').classes('text-gray-400')
-                res_h_input = ui.number('Height', value=1080, min=1).classes('w-24')
+                res_h_input = ui.number('Height', value=1080, min=1, on_change=lambda: on_resolution_change()).classes('w-24')
                 res_h_input.bind_value(form, 'res_height')
             
+            def active_scale():
+                current_scale = get_current_scale()
+                for scale, _ in _RES_SCALES:
+                    if abs(current_scale - scale) < 0.01:
+                        return scale
+                return None
+            
+            # Only the highlighted button depends on the size, so the buttons are
+            # rebuilt when it moves; the size label is patched in place
+            shown_scale = {'active': None}
+            
             @ui.refreshable
             def resolution_scale_buttons():
-                current_scale = get_current_scale()
-                scales = [(0.25, '25%'), (0.5, '50%'), (1.0, '100%'), (1.5, '150%'), (2.0, '200%')]
-                with ui.row().classes('w-full items-center gap-1 flex-wrap'):
-                    ui.label('Scale:').classes('text-xs text-gray-500 mr-1')
-                    for scale, label in scales:
-                        is_active = abs(current_scale - scale) < 0.01
-                        btn_style = 'background-color: #3f3f46 !important;' if is_active else 'background-color: transparent !important; color: #71717a !important;'
-                        ui.button(label, on_click=lambda s=scale: apply_scale(s)).props('flat dense').classes('text-xs px-2 py-1').style(btn_style)
-                    ui.label(f'{form["res_width"]}×{form["res_height"]}').classes('text-xs text-gray-500 ml-2')
-            
-            res_scale_container = resolution_scale_buttons
-            resolution_scale_buttons()
+                shown_scale['active'] = active = active_scale()
+                for scale, label in _RES_SCALES:
+                    btn_style = 'background-color: #3f3f46 !important;' if scale == active else 'background-color: transparent !important; color: #71717a !important;'
+                    ui.button(label, on_click=lambda s=scale: apply_scale(s)).props('flat dense').classes('text-xs px-2 py-1').style(btn_style)
+            
+            with ui.row().classes('w-full items-center gap-1 flex-wrap'):
+                ui.label('Scale:').classes('text-xs text-gray-500 mr-1')
+                resolution_scale_buttons()
+                size_label = ui.label(f'{form["res_width"]}×{form["res_height"]}').classes('text-xs text-gray-500 ml-2')
+            
+            scale_refresh = Debouncer(resolution_scale_buttons.refresh, 0.15)
+            
+            def on_resolution_change():
+                size_label.set_text(f'{form["res_width"]}×{form["res_height"]}')
+                # Spinner clicks fire a change per step; rebuild once they settle
+                if active_scale() != shown_scale['active']:
+                    scale_refresh.schedule()
             
             # Camera (always visible)
             camera_select = ui.select(['Scene Default'], value='Scene Default', label='Camera').classes('w-full')
@@ -297,105 +448,105 @@ async def show_add_job_dialog():
                 frame_end_input.bind_value(form, 'frame_end')
             
             # Engine-specific settings section
+            def toggle_custom(e):
+                form['vantage_use_custom'] = e.value
+                vantage_custom_settings.refresh()
+            
+            # Split out so toggling custom settings only rebuilds this part
             @ui.refreshable
-            def engine_settings_section():
-                if form['engine_type'] == 'vantage':
-                    ui.separator()
-                    ui.label('Vantage HQ Settings').classes('text-sm font-bold').style('color: #77b22a;')
-                    
-                    # Toggle for custom settings
-                    def toggle_custom(e):
-                        form['vantage_use_custom'] = e.value
-                        engine_settings_section.refresh()
-                    
-                    ui.checkbox('Use Custom Settings', value=form['vantage_use_custom'], on_change=toggle_custom).props('dense').classes('mt-1')
-                    
-                    if form['vantage_use_custom']:
-                        # Custom settings - will be applied to vantage.ini before render
-                        with ui.column().classes('w-full gap-2 pl-6 mt-2'):
-                            ui.label('These settings will override your Vantage defaults:').classes('text-xs text-zinc-400')
-                            
-                            with ui.row().classes('w-full items-center gap-2'):
-                                ui.label('Resolution:').classes('text-sm text-gray-400 w-20')
-                                ui.label(f'{form["res_width"]} × {form["res_height"]}').classes('text-sm text-white')
-                                ui.label('(from above)').classes('text-xs text-zinc-500')
-                            
-                            with ui.row().classes('w-full items-center gap-2'):
-                                ui.number('Samples', value=form['vantage_samples'], min=1, max=65536).bind_value(form, 'vantage_samples').classes('w-28')
-                                ui.select(
-                                    options=[
-                                        {'label': 'NVIDIA OptiX AI', 'value': 'nvidia'},
-                                        {'label': 'Intel OIDN', 'value': 'oidn'},
-                                        {'label': 'Off', 'value': 'off'},
-                                    ],
-                                    value=form['vantage_denoiser'],
-                                    label='Denoiser'
-                                ).bind_value(form, 'vantage_denoiser').classes('w-40')
-                            
-                            with ui.row().classes('w-full items-center gap-2 mt-1'):
-                                ui.icon('warning').classes('text-amber-500')
-                                ui.label('A backup of vantage.ini will be created before modifying.').classes('text-xs text-amber-500')
-                    else:
-                        # Default mode - use scene settings
-                        with ui.row().classes('w-full items-center gap-2 pl-6 mt-1'):
-                            ui.icon('info').classes('text-zinc-400')
-                            ui.label('Will use the HQ settings already configured in Vantage.').classes('text-xs text-zinc-400')
+            def vantage_custom_settings():
+                if form['vantage_use_custom']:
+                    # Custom settings - will be applied to vantage.ini before render
+                    with ui.column().classes('w-full gap-2 pl-6 mt-2'):
+                        ui.label('These settings will override your Vantage defaults:').classes(_CLS_HINT)
+                        
+                        with ui.row().classes(_CLS_ROW):
+                            ui.label('Resolution:').classes('text-sm text-gray-400 w-20')
+                            ui.label(f'{form["res_width"]} × {form["res_height"]}').classes('text-sm text-white')
+                            ui.label('(from above)').classes('text-xs text-zinc-500')
+                        
+                        with ui.row().classes(_CLS_ROW):
+                            ui.number('Samples', value=form['vantage_samples'], min=1, max=65536).bind_value(form, 'vantage_samples').classes('w-28')
+                            ui.select(
+                                options=VANTAGE_DENOISER_OPTIONS,
+                                value=form['vantage_denoiser'],
+                                label='Denoiser'
+                            ).bind_value(form, 'vantage_denoiser').classes('w-40')
+                        
+                        with ui.row().classes('w-full items-center gap-2 mt-1'):
+                            ui.icon('warning').classes('text-amber-500')
+                            ui.label('A backup of vantage.ini will be created before modifying.').classes('text-xs text-amber-500')
+                else:
+                    # Default mode - use scene settings
+                    with ui.row().classes('w-full items-center gap-2 pl-6 mt-1'):
+                        ui.icon('info').classes('text-zinc-400')
+                        ui.label('Will use the HQ settings already configured in Vantage.').classes(_CLS_HINT)
+            
+            # Each engine's settings are built once and shown/hidden on engine switch
+            with ui.column().classes('w-full gap-3') as vantage_box:
+                ui.separator()
+                ui.label('Vantage HQ Settings').classes('text-sm font-bold').style('color: #77b22a;')
                 
-                elif form['engine_type'] == 'marmoset':
-                    ui.separator()
-                    ui.label('Marmoset Settings').classes('text-sm font-bold text-gray-400')
-                    with ui.row().classes('w-full items-center gap-2'):
-                        ui.select(options=['still', 'turntable', 'animation'], value=form.get('render_type', 'still'), label='Render Type').bind_value(form, 'render_type').classes('w-32')
-                        ui.number('Samples', value=form.get('samples', 256), min=1, max=4096).bind_value(form, 'samples').classes('w-24')
+                # Toggle for custom settings
+                vantage_custom_checkbox = ui.checkbox('Use Custom Settings', value=form['vantage_use_custom'], on_change=toggle_custom).props('dense').classes('mt-1')
+                vantage_custom_settings()
             
-            accent_elements['engine_settings'] = engine_settings_section
-            engine_settings_section()
+            with ui.column().classes('w-full gap-3') as marmoset_box:
+                ui.separator()
+                ui.label('Marmoset Settings').classes('text-sm font-bold text-gray-400')
+                with ui.row().classes(_CLS_ROW):
+                    ui.select(options=MARMOSET_RENDER_TYPES, value=form['render_type'], label='Render Type').bind_value(form, 'render_type').classes('w-32')
+                    ui.number('Samples', value=form['samples'], min=1, max=4096).bind_value(form, 'samples').classes('w-24')
+            
+            def update_engine_visibility():
+                vantage_box.set_visibility(form['engine_type'] == 'vantage')
+                marmoset_box.set_visibility(form['engine_type'] == 'marmoset')
+            
+            update_engine_visibility()
             
             ui.separator()
             with ui.row().classes('w-full gap-4'):
                 ui.checkbox('Overwrite Existing', value=True).props('dense').bind_value(form, 'overwrite_existing')
                 ui.checkbox('Submit as Paused').props('dense').bind_value(form, 'submit_paused')
         
-        with ui.row().classes('w-full justify-end gap-2 p-4 border-t border-zinc-700'):
+        with ui.row().classes(_CLS_FOOTER):
             ui.button('Cancel', on_click=dialog.close).props('flat')
             
             def submit():
                 if not form['file_path'] or not form['output_folder']:
                     return
+                # The form is bound directly, so a pending scale-row refresh is display only
+                scale_refresh.cancel()
                 
-                engine_settings = {}
-                if form['engine_type'] == 'vantage':
-                    if form['vantage_use_custom']:
-                        engine_settings = {
-                            'use_custom_settings': True,
-                            'width': int(form['res_width']),
-                            'height': int(form['res_height']),
-                            'samples': int(form['vantage_samples']),
-                            'denoiser': form['vantage_denoiser'],
-                        }
-                    else:
-                        engine_settings = {'use_custom_settings': False}
-                elif form['engine_type'] == 'marmoset':
+                res_width = int(form['res_width'])
+                res_height = int(form['res_height'])
+                frame_start = int(form['frame_start'])
+                
+                engine_type = form['engine_type']
+                if engine_type == 'vantage' and not form['vantage_use_custom']:
+                    engine_settings = {'use_custom_settings': False}
+                else:
                     engine_settings = {
-                        "render_type": form.get('render_type', 'still'),
-                        "samples": int(form.get('samples', 256)),
-                        "render_passes": form.get('render_passes', ['beauty'])
+                        key: cast(form[src]) if cast else form[src]
+                        for key, src, cast in _ENGINE_SETTINGS_FIELDS.get(engine_type, ())
                     }
+                    if engine_type == 'vantage':
+                        engine_settings.update(use_custom_settings=True, width=res_width, height=res_height)
                 
                 job = RenderJob(
                     name=form['name'] or "Untitled",
-                    engine_type=form['engine_type'],
+                    engine_type=engine_type,
                     file_path=form['file_path'],
                     output_folder=form['output_folder'],
                     output_name=form['output_name'],
                     output_format=form['output_format'],
                     camera=form['camera'],
                     is_animation=form['is_animation'],
-                    frame_start=int(form['frame_start']),
+                    frame_start=frame_start,
                     frame_end=int(form['frame_end']),
-                    original_start=int(form['frame_start']),
-                    res_width=int(form['res_width']),
-                    res_height=int(form['res_height']),
+                    original_start=frame_start,
+                    res_width=res_width,
+                    res_height=res_height,
                     overwrite_existing=form.get('overwrite_existing', True),
                     status='paused' if form['submit_paused'] else 'queued',
                     engine_settings=engine_settings,
@@ -404,16 +555,31 @@ async def show_add_job_dialog():
                 render_app.add_job(job)
                 dialog.close()
             
-            initial_accent = ENGINE_COLORS.get(form['engine_type'], "#ea7600")
-            submit_btn = ui.button('Submit Job', on_click=submit).style(f'background-color: {initial_accent} !important;')
-            accent_elements['submit_btn'] = submit_btn
+            submit_btn = ui.button('Submit Job', on_click=submit).style(_ACCENT_STYLE.get(form['engine_type'], _ACCENT_STYLE_DEFAULT))
+    
+    def reset_form():
+        """Put the reused dialog back in its freshly opened state."""
+        nonlocal probe_generation
+        probe_generation += 1
+        select_engine(_ADD_JOB_DEFAULTS['engine_type'])
+        # Cleared rather than updated, so keys a probe added (e.g. vantage_fps) go too;
+        # the same dict stays bound, and bound inputs pick the defaults up from it
+        form.clear()
+        form.update(_ADD_JOB_DEFAULTS, render_passes=list(_ADD_JOB_DEFAULTS['render_passes']))
+        camera_select.set_options(['Scene Default'], value='Scene Default')
+        vantage_custom_checkbox.value = False
+        status_label.set_text('Select a scene file to load settings')
+        status_label.classes(replace='text-xs text-gray-500 flex-grow')
+        scale_refresh.schedule()
     
+    _cache_dialog(_add_job_dialog_cache, sig, dialog, reset_form)
     dialog.open()
 
 
 async def show_edit_job_dialog(job):
     """Edit an existing job's settings."""
     accent_color = ENGINE_COLORS.get(job.engine_type, "#71717a")
+    accent_style = _ACCENT_STYLE.get(job.engine_type, _ACCENT_STYLE_DEFAULT)
     
     form = {
         'name': job.name,
@@ -429,16 +595,31 @@ async def show_edit_job_dialog(job):
         'res_height': job.res_height,
         'overwrite_existing': job.overwrite_existing,
     }
+    # Everything the dialog shows, including the fixed status/progress line
+    sig = (job.id, job.engine_type, job.status, job.progress, tuple(form.values()))
+    if _reopen_cached_dialog(_edit_dialog_cache, sig):
+        return
+    
+    # Widgets stage their edits here; the form is only written once, on save
+    staged = {}
+    
+    def stage(key):
+        return lambda e: staged.__setitem__(key, e.value)
+    
+    def on_hide():
+        # Closed with unsaved edits - rebuild next time so they are discarded
+        if staged:
+            _edit_dialog_cache['sig'] = None
     
     with ui.dialog() as dialog, ui.card().style('width: 600px; max-width: 95vw; padding: 0;'):
-        with ui.row().classes('w-full items-center justify-between p-4'):
+        with ui.row().classes(_CLS_HEADER):
             ui.label('Edit Job').classes('text-lg font-bold')
             ui.button(icon='close', on_click=dialog.close).props('flat round dense size=sm')
         
         with ui.column().classes('w-full p-4 gap-3').style('max-height: 70vh; overflow-y: auto;'):
             # Engine display
-            with ui.row().classes('w-full items-center gap-2'):
-                ui.label('Engine:').classes('text-gray-400 w-20')
+            with ui.row().classes(_CLS_ROW):
+                ui.label('Engine:').classes(_CLS_FIELD_LABEL)
                 engine_logo = AVAILABLE_LOGOS.get(job.engine_type)
                 with ui.row().classes('items-center gap-2 px-3 py-2 rounded').style(f'background-color: {accent_color}; color: white;'):
                     if engine_logo:
@@ -448,38 +629,38 @@ async def show_edit_job_dialog(job):
                     engine = render_app.engine_registry.get(job.engine_type)
                     ui.label(engine.name if engine else job.engine_type).classes('text-sm')
             
-            ui.input('Job Name', value=form['name']).bind_value(form, 'name').classes('w-full')
+            ui.input('Job Name', value=form['name'], on_change=stage('name')).classes('w-full')
             
-            ui.label('Scene File:').classes('text-sm text-gray-400')
-            ui.input(value=form['file_path']).bind_value(form, 'file_path').classes('w-full')
+            ui.label('Scene File:').classes(_CLS_SECTION_LABEL)
+            ui.input(value=form['file_path'], on_change=stage('file_path')).classes('w-full')
             
-            ui.label('Output Folder:').classes('text-sm text-gray-400')
-            ui.input(value=form['output_folder']).bind_value(form, 'output_folder').classes('w-full')
+            ui.label('Output Folder:').classes(_CLS_SECTION_LABEL)
+            ui.input(value=form['output_folder'], on_change=stage('output_folder')).classes('w-full')
             
             with ui.row().classes('w-full gap-2'):
-                ui.input('Prefix', value=form['output_name']).bind_value(form, 'output_name').classes('flex-grow')
-                ui.select(['PNG', 'JPEG', 'OpenEXR', 'TIFF'], value=form['output_format'], label='Format').bind_value(form, 'output_format').classes('w-28')
+                ui.input('Prefix', value=form['output_name'], on_change=stage('output_name')).classes('flex-grow')
+                ui.select(['PNG', 'JPEG', 'OpenEXR', 'TIFF'], value=form['output_format'], label='Format', on_change=stage('output_format')).classes('w-28')
             
-            with ui.row().classes('w-full items-center gap-2'):
-                ui.number('Width', value=form['res_width'], min=1).bind_value(form, 'res_width').classes('w-24')
+            with ui.row().classes(_CLS_ROW):
+                ui.number('Width', value=form['res_width'], min=1, on_change=stage('res_width')).classes('w-24')
                 ui.label('x').classes('text-gray-400')
-                ui.number('Height', value=form['res_height'], min=1).bind_value(form, 'res_height').classes('w-24')
+                ui.number('Height', value=form['res_height'], min=1, on_change=stage('res_height')).classes('w-24')
             
             with ui.row().classes('w-full items-center gap-3'):
-                ui.checkbox('Animation', value=form['is_animation']).props('dense').bind_value(form, 'is_animation')
-                ui.number('Start', value=form['frame_start'], min=1).bind_value(form, 'frame_start').classes('w-20')
+                ui.checkbox('Animation', value=form['is_animation'], on_change=stage('is_animation')).props('dense')
+                ui.number('Start', value=form['frame_start'], min=1, on_change=stage('frame_start')).classes('w-20')
                 ui.label('to').classes('text-gray-400')
-                ui.number('End', value=form['frame_end'], min=1).bind_value(form, 'frame_end').classes('w-20')
+                ui.number('End', value=form['frame_end'], min=1, on_change=stage('frame_end')).classes('w-20')
             
             ui.separator()
-            ui.checkbox('Overwrite Existing', value=form['overwrite_existing']).props('dense').bind_value(form, 'overwrite_existing')
+            ui.checkbox('Overwrite Existing', value=form['overwrite_existing'], on_change=stage('overwrite_existing')).props('dense')
             
             # Vantage info
             if job.engine_type == 'vantage':
                 ui.separator()
-                with ui.row().classes('w-full items-center gap-2'):
+                with ui.row().classes(_CLS_ROW):
                     ui.icon('info').classes('text-zinc-500')
-                    ui.label('Vantage uses HQ settings from the scene file').classes('text-xs text-zinc-400')
+                    ui.label('Vantage uses HQ settings from the scene file').classes(_CLS_HINT)
             
             # Status info
             ui.separator()
@@ -488,49 +669,64 @@ async def show_edit_job_dialog(job):
                 status_text += f" ({job.progress}%)"
             ui.label(status_text).classes('text-sm text-gray-500')
         
-        with ui.row().classes('w-full justify-end gap-2 p-4 border-t border-zinc-700'):
+        with ui.row().classes(_CLS_FOOTER):
             ui.button('Cancel', on_click=dialog.close).props('flat')
             
+            def apply_staged() -> bool:
+                """Write staged edits onto the job; True if anything changed."""
+                form.update(staged)
+                staged.clear()
+                before = _edited_fields(job)
+                apply_form_to_job(job, form)
+                return _edited_fields(job) != before
+            
             def save_changes():
-                job.name = form['name'] or "Untitled"
-                job.file_path = form['file_path']
-                job.output_folder = form['output_folder']
-                job.output_name = form['output_name']
-                job.output_format = form['output_format']
-                job.res_width = int(form['res_width'])
-                job.res_height = int(form['res_height'])
-                job.is_animation = form['is_animation']
-                job.frame_start = int(form['frame_start'])
-                job.frame_end = int(form['frame_end'])
-                job.overwrite_existing = form['overwrite_existing']
+                card_before = _card_fields(job)
+                if not apply_staged():
+                    # Nothing changed - skip the disk write and queue refresh
+                    dialog.close()
+                    return
                 
                 render_app.save_config()
                 render_app.log(f"Updated: {job.name}")
-                if render_app.queue_container:
-                    render_app.queue_container.refresh()
+                render_app.refresh_ui(jobs=_card_fields(job) != card_before, stats=False, count=False)
                 dialog.close()
             
             def resubmit():
-                save_changes()
+                if apply_staged():
+                    render_app.log(f"Updated: {job.name}")
                 job.status = 'queued'
                 job.progress = 0
                 job.current_frame = 0
                 job.error_message = ""
+                # One save and one refresh pass for the edit and the requeue together
                 render_app.save_config()
-                if render_app.queue_container:
-                    render_app.queue_container.refresh()
-                if render_app.stats_container:
-                    render_app.stats_container.refresh()
+                render_app.refresh_ui(count=False)
+                render_app.wake_queue(job)
+                dialog.close()
             
             if job.status in ['completed', 'failed']:
-                ui.button('Resubmit', icon='refresh', on_click=resubmit).style(f'background-color: {accent_color} !important;')
+                ui.button('Resubmit', icon='refresh', on_click=resubmit).style(accent_style)
             else:
-                ui.button('Save', on_click=save_changes).style(f'background-color: {accent_color} !important;')
+                ui.button('Save', on_click=save_changes).style(accent_style)
     
+    dialog.on('hide', on_hide)
+    _cache_dialog(_edit_dialog_cache, sig, dialog)
     dialog.open()
 
 
+def _engine_state_signature() -> tuple:
+    return tuple(
+        (e.engine_type, e.is_available, tuple(e.sorted_versions))
+        for e in render_app.engine_registry.get_all()
+    )
+
+
 async def show_settings_dialog():
+    sig = _engine_state_signature()
+    if _reopen_cached_dialog(_settings_dialog_cache, sig):
+        return
+    
     with ui.dialog() as dialog, ui.card().style('width: 550px; max-width: 95vw; padding: 0;'):
         with ui.row().classes('w-full items-center justify-between p-4 border-b border-zinc-700'):
             ui.label('Settings').classes('text-lg font-bold')
@@ -538,14 +734,12 @@ async def show_settings_dialog():
         
         with ui.column().classes('w-full p-4 gap-4'):
             for engine in render_app.engine_registry.get_all():
-                engine_logo = AVAILABLE_LOGOS.get(engine.engine_type)
-                engine_icon = ENGINE_ICONS.get(engine.engine_type, 'help')
-                engine_color = ENGINE_COLORS.get(engine.engine_type, "#3f3f46")
+                logo_url, engine_color, engine_icon = ENGINE_UI.get(engine.engine_type, (None, "#3f3f46", 'help'))
                 
                 with ui.card().classes('w-full p-3'):
                     with ui.row().classes('items-center gap-2 mb-2'):
-                        if engine_logo:
-                            ui.image(f'/logos/{engine_logo}?{ASSET_VERSION}').classes('w-6 h-6 object-contain')
+                        if logo_url:
+                            ui.image(logo_url).classes('w-6 h-6 object-contain')
                         else:
                             ui.icon(engine_icon).classes('text-xl').style(f'color: {engine_color}')
                         ui.label(engine.name).classes('font-bold')
@@ -553,7 +747,7 @@ async def show_settings_dialog():
                         ui.label(status).classes('text-sm text-zinc-400' if engine.is_available else 'text-sm text-zinc-600')
                     
                     if engine.installed_versions:
-                        for v, p in sorted(engine.installed_versions.items(), reverse=True):
+                        for v, p in engine.sorted_versions:
                             with ui.row().classes('items-center gap-2 mb-1'):
                                 ui.badge(v).style(f'background-color: {engine_color} !important;')
                                 ui.label(p).classes('text-xs text-gray-500 truncate').style('max-width: 350px')
@@ -563,4 +757,5 @@ async def show_settings_dialog():
         with ui.row().classes('w-full justify-end p-4 border-t border-zinc-700'):
             ui.button('Close', on_click=dialog.close).props('flat')
     
+    _cache_dialog(_settings_dialog_cache, sig, dialog)
     dialog.open()
@@ -5,28 +5,51 @@ The primary application page layout and UI.
 
 import os
 import sys
+import json
+from itertools import islice
 from nicegui import ui, app
 
 from wain.config import DARK_THEME, AVAILABLE_LOGOS, ASSET_VERSION, APP_VERSION
 from wain.app import render_app
 from wain.ui.components import create_stat_card, create_job_card
 from wain.ui.dialogs import show_add_job_dialog, show_settings_dialog
+from wain.utils.debounce import DebouncedRefresh
+
+# Job count labels by count, filled on first use
+_JOB_COUNT_LABELS = {1: '1 job'}
+
+
+def _job_count_label(count: int) -> str:
+    label = _JOB_COUNT_LABELS.get(count)
+    if label is None:
+        label = _JOB_COUNT_LABELS[count] = f'{count} jobs'
+    return label
+
 
 @ui.page('/')
 def main_page():
     ui.dark_mode().enable()
     ui.colors(**DARK_THEME['colors'])
     
+    # Start fetching the header logo while the head is still parsing
+    wain_logo = AVAILABLE_LOGOS.get('wain')
+    if wain_logo:
+        ui.add_head_html(f'<link rel="preload" as="image" href="/logos/{wain_logo}?{ASSET_VERSION}">')
+    
     # Add CSS
     ui.add_head_html('''<style>
-        *, *::before, *::after { box-sizing: border-box; }
+        /* Scoped to the app's own containers; Quasar already gives its components border-box */
+        .wain-root, .wain-root *, .wain-root *::before, .wain-root *::after { box-sizing: border-box; }
         .responsive-container { width: 100%; max-width: 100%; padding: 1rem; overflow-x: hidden; }
         .stat-card { min-width: 150px; flex: 1 1 200px; }
         .job-card { width: 100%; }
+        /* Keep reflow from a card or log update inside that element */
+        .job-card, .stat-card, #wain-log { contain: layout style paint; }
         
-        /* Hide NiceGUI reconnection notification - we're a desktop app */
-        .q-notification, .q-notifications, .nicegui-reconnecting, 
-        div[class*="reconnect"], div[class*="connection"] {
+        /* Hide NiceGUI reconnection notification - we're a desktop app.
+           Known classes are listed here; anything else is tagged by the observer
+           in the script below. */
+        .q-notification, .q-notifications, .nicegui-reconnecting, .wain-hide-reconnect {
             display: none !important;
             visibility: hidden !important;
             opacity: 0 !important;
@@ -53,9 +76,10 @@ def main_page():
         ::-webkit-scrollbar-thumb { background: #3f3f46; border-radius: 4px; }
         ::-webkit-scrollbar-thumb:hover { background: #52525b; }
         
-        .custom-progress-container { width: 100%; display: flex; flex-direction: column; gap: 4px; min-height: 28px; }
+        .custom-progress-container { width: 100%; display: flex; flex-direction: column; gap: 4px; min-height: 28px; contain: layout paint; }
         .custom-progress-track { width: 100%; height: 8px; background: rgba(255, 255, 255, 0.15); border-radius: 4px; overflow: hidden; position: relative; }
-        .custom-progress-fill { height: 100%; border-radius: 4px; position: relative; background: #71717a; will-change: width; }
+        /* Fill spans the track and is scaled, so progress changes skip layout and paint */
+        .custom-progress-fill { width: 100%; height: 100%; border-radius: 4px; position: relative; overflow: hidden; background: #71717a; transform-origin: left center; transform: scaleX(0); }
         .custom-progress-label { text-align: center; font-size: 14px; color: #a1a1aa; }
         
         .custom-progress-rendering.custom-progress-engine-blender .custom-progress-fill { background: #ea7600; }
@@ -66,6 +90,7 @@ def main_page():
         .custom-progress-completed .custom-progress-fill { background: #22c55e; }
         .custom-progress-failed .custom-progress-fill { background: #ef4444; }
         
+        /* Scales with the fill and is clipped to it, so it sweeps over the filled part only */
         .custom-progress-rendering .custom-progress-fill::after {
             content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
             background: linear-gradient(90deg, transparent 0%, rgba(255, 255, 255, 0.4) 50%, transparent 100%);
@@ -84,6 +109,13 @@ def main_page():
             content: '';
             animation: dots 1.5s steps(4, end) infinite;
         }
+        #wain-log { overflow-y: auto; }
+        .wain-log-line {
+            height: 16px; line-height: 16px; color: #9ca3af;
+            white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
+            cursor: text; user-select: all;
+        }
+        
         @keyframes dots {
             0%, 20% { content: ''; }
             40% { content: '.'; }
@@ -94,87 +126,231 @@ def main_page():
     
     # Add JavaScript for progress animation
     ui.add_head_html('''<script>
-        document.addEventListener('DOMContentLoaded', function() {
+        // Runs as soon as the script is parsed; nothing below needs the body to exist yet
+        (function() {
             const progressState = {};
-            window.updateJobProgress = function(jobId, progress, elapsed, framesDisplay, samplesDisplay, passDisplay, statusMsg) {
-                const fill = document.getElementById('progress-fill-' + jobId);
-                const label = document.getElementById('progress-label-' + jobId);
-                const info = document.getElementById('job-info-' + jobId);
-                const renderProgress = document.getElementById('job-render-progress-' + jobId);
-                const statusMsgEl = document.getElementById('job-status-msg-' + jobId);
+            
+            // Latest update per job; written to the DOM once per animation frame
+            const pending = {};
+            let flushScheduled = false;
+            
+            // Element refs per job. Queue refreshes replace the cards, so a cached
+            // entry is looked up again once its info element is detached.
+            const jobEls = {};
+            function getJobEls(jobId) {
+                let els = jobEls[jobId];
+                if (!els || !els.info || !els.info.isConnected) {
+                    els = jobEls[jobId] = {
+                        jobId: jobId,
+                        fill: document.getElementById('progress-fill-' + jobId),
+                        label: document.getElementById('progress-label-' + jobId),
+                        info: document.getElementById('job-info-' + jobId),
+                        time: document.getElementById('job-time-' + jobId),
+                        renderProgress: document.getElementById('job-render-progress-' + jobId),
+                        statusMsgEl: document.getElementById('job-status-msg-' + jobId),
+                    };
+                }
+                return els;
+            }
+            
+            // Called by the server: [[jobId, progress, elapsed, renderProgress, statusMsg], ...]
+            // The server composes the text, so updates here are plain text assignments
+            window.wainApplyUpdates = function(updates) {
+                for (const u of updates) pending[u[0]] = u.slice(1);
+                if (updates.length && !flushScheduled) {
+                    flushScheduled = true;
+                    requestAnimationFrame(flushJobUpdates);
+                }
+            };
+            
+            function flushJobUpdates() {
+                flushScheduled = false;
+                
+                // Read phase: resolve every job's elements first, so the writes
+                // below never force a layout between jobs
+                const batch = [];
+                for (const jobId in pending) {
+                    batch.push([getJobEls(jobId), pending[jobId]]);
+                    delete pending[jobId];
+                }
+                
+                // Write phase
+                for (const [els, update] of batch) writeJobUpdate(els, ...update);
+            }
+            
+            function writeJobUpdate(item, progress, elapsed, renderProgress, statusMsg) {
+                const jobId = item.jobId, fill = item.fill, label = item.label, info = item.info;
+                const statusMsgEl = item.statusMsgEl;
                 
                 if (fill) fill.dataset.target = progress;
                 if (label) label.textContent = progress + '%';
-                if (info && elapsed) {
-                    var baseText = info.textContent;
-                    if (renderProgress) baseText = baseText.replace(renderProgress.textContent, '').trim();
-                    if (baseText.includes('Time:')) baseText = baseText.replace(/Time: [0-9:]+/, 'Time: ' + elapsed);
-                    else baseText = baseText + ' | Time: ' + elapsed;
-                    
-                    var progressParts = [];
-                    if (passDisplay && passDisplay.length > 0) progressParts.push(passDisplay);
-                    if (framesDisplay && framesDisplay.length > 0 && framesDisplay.includes('/')) {
-                        progressParts.push('Frame ' + framesDisplay);
-                    }
-                    if (samplesDisplay && samplesDisplay.length > 0) {
-                        progressParts.push(samplesDisplay);
-                    }
-                    var progressText = progressParts.length > 0 ? ' | ' + progressParts.join(' | ') : '';
-                    info.innerHTML = baseText + '<span id="job-render-progress-' + jobId + '">' + progressText + '</span>';
-                }
+                // The rendering job's time comes from the local clock and arrives empty
+                if (elapsed && item.time) item.time.textContent = ' | Time: ' + elapsed;
+                if (item.renderProgress) item.renderProgress.textContent = renderProgress;
                 
                 // Update status message
                 if (statusMsg && statusMsg.length > 0) {
                     if (statusMsgEl) {
                         statusMsgEl.textContent = statusMsg;
-                    } else {
+                    } else if (info && info.parentNode) {
                         // Create status message element if it doesn't exist
-                        var infoEl = document.getElementById('job-info-' + jobId);
-                        if (infoEl && infoEl.parentNode) {
-                            var msgDiv = document.createElement('div');
-                            msgDiv.id = 'job-status-msg-' + jobId;
-                            msgDiv.className = 'job-status-message';
-                            msgDiv.textContent = statusMsg;
-                            infoEl.parentNode.insertBefore(msgDiv, infoEl.nextSibling);
-                        }
+                        var msgDiv = document.createElement('div');
+                        msgDiv.id = 'job-status-msg-' + jobId;
+                        msgDiv.className = 'job-status-message';
+                        msgDiv.textContent = statusMsg;
+                        info.parentNode.insertBefore(msgDiv, info.nextSibling);
+                        item.statusMsgEl = msgDiv;
                     }
                 } else if (statusMsgEl) {
                     statusMsgEl.textContent = '';
                 }
+            }
+            
+            // Elapsed time of the rendering job, counted locally from the seconds the
+            // server sent when the render started or resumed
+            let clock = null;
+            window.wainSetClock = function(jobId, secs) {
+                clock = jobId === null ? null : {jobId: jobId, base: secs, anchor: performance.now(), shown: -1};
             };
             
-            function animateProgressBars() {
-                document.querySelectorAll('.custom-progress-fill[data-target]').forEach(function(fill) {
+            function tickClock(now) {
+                const secs = clock.base + Math.floor((now - clock.anchor) / 1000);
+                if (secs === clock.shown) return;
+                const el = getJobEls(clock.jobId).time;
+                if (!el) return;
+                clock.shown = secs;
+                const m = Math.floor(secs / 60) % 60, s = secs % 60;
+                el.textContent = ' | Time: ' + Math.floor(secs / 3600) + ':' + (m < 10 ? '0' : '') + m + ':' + (s < 10 ? '0' : '') + s;
+            }
+            
+            // Live collection: tracks cards as they are added/removed without a
+            // selector query every frame
+            const fills = document.getElementsByClassName('custom-progress-fill');
+            
+            // Bars animate at ~30 Hz with time-based easing, so the speed is the
+            // same on 60 Hz and high-refresh displays
+            let lastTick = 0;
+            
+            function animateProgressBars(now) {
+                requestAnimationFrame(animateProgressBars);
+                const dt = now - lastTick;
+                if (dt < 33) return;
+                lastTick = now;
+                if (clock) tickClock(now);
+                const ease = 1 - Math.exp(-3.6 * dt / 1000);
+                const minStep = 9 * dt / 1000;
+                
+                for (const fill of fills) {
                     const id = fill.id;
-                    if (!id) return;
+                    if (!id || !fill.dataset.target) continue;
                     const target = parseFloat(fill.dataset.target) || 0;
                     
                     if (!(id in progressState)) {
-                        const inlineWidth = parseFloat(fill.style.width) || 0;
-                        progressState[id] = inlineWidth > 0 ? inlineWidth : target;
-                        if (inlineWidth <= 0) fill.style.width = target + '%';
-                        return;
+                        const inlineProgress = (parseFloat(fill.style.transform.replace('scaleX(', '')) || 0) * 100;
+                        progressState[id] = inlineProgress > 0 ? inlineProgress : target;
+                        if (inlineProgress <= 0) fill.style.transform = 'scaleX(' + (target / 100) + ')';
+                        continue;
                     }
                     
                     const current = progressState[id];
                     const diff = target - current;
                     
                     if (Math.abs(diff) > 0.1) {
-                        let step = diff * 0.06;
-                        if (Math.abs(step) < 0.15 && Math.abs(diff) > 0.15) step = diff > 0 ? 0.15 : -0.15;
+                        // Hold a compositor layer only while the bar is moving
+                        if (fill.style.willChange !== 'transform') fill.style.willChange = 'transform';
+                        let step = diff * ease;
+                        if (Math.abs(step) < minStep) step = Math.abs(diff) > minStep ? Math.sign(diff) * minStep : diff;
                         progressState[id] = current + step;
-                        fill.style.width = progressState[id] + '%';
+                        fill.style.transform = 'scaleX(' + (progressState[id] / 100) + ')';
+                    } else if (fill.style.willChange === 'transform') {
+                        fill.style.willChange = 'auto';
                     }
-                });
-                requestAnimationFrame(animateProgressBars);
+                }
             }
             requestAnimationFrame(animateProgressBars);
-        });
+            
+            // Log view: every line has the same height, so only the lines in view
+            // (plus some overscan) are rendered, offset by padding
+            const LOG_LINE_HEIGHT = 16;
+            let logLines = [];
+            let logRenderScheduled = false;
+            let logObserved = null;
+            
+            window.wainSetLog = function(lines) {
+                logLines = lines;
+                // Re-render when the view resizes, e.g. when the Log expansion opens
+                const view = document.getElementById('wain-log');
+                if (view && view !== logObserved) {
+                    logObserved = view;
+                    new ResizeObserver(scheduleLogRender).observe(view);
+                }
+                scheduleLogRender();
+            };
+            
+            function scheduleLogRender() {
+                if (logRenderScheduled) return;
+                logRenderScheduled = true;
+                requestAnimationFrame(renderLog);
+            }
+            
+            function renderLog() {
+                logRenderScheduled = false;
+                const view = document.getElementById('wain-log');
+                if (!view) return;
+                const list = view.firstElementChild;
+                const first = Math.max(0, Math.floor(view.scrollTop / LOG_LINE_HEIGHT) - 4);
+                const last = Math.min(logLines.length, first + Math.ceil(view.clientHeight / LOG_LINE_HEIGHT) + 8);
+                
+                const frag = document.createDocumentFragment();
+                for (let i = first; i < last; i++) {
+                    const line = document.createElement('div');
+                    line.className = 'wain-log-line';
+                    line.textContent = logLines[i];
+                    line.title = logLines[i];
+                    frag.appendChild(line);
+                }
+                list.style.height = (logLines.length * LOG_LINE_HEIGHT) + 'px';
+                list.style.paddingTop = (first * LOG_LINE_HEIGHT) + 'px';
+                list.replaceChildren(frag);
+            }
+            
+            // Scroll events don't bubble; capture them for the log view
+            document.addEventListener('scroll', function(e) {
+                if (e.target.id === 'wain-log') scheduleLogRender();
+            }, true);
+            
+            // Tag notification/reconnect elements as they are added or their class
+            // changes, rather than matching class substrings against every div on
+            // each style recalc
+            const HIDE_RE = /reconnect|connection|q-notification/;
+            const HIDE_SELECTOR = '.q-notification, .q-notifications, [class*="reconnect"], [class*="connection"]';
+            function tagOne(el) {
+                // The contains() check also stops our own class change from re-triggering
+                if (typeof el.className === 'string' && HIDE_RE.test(el.className)
+                        && !el.classList.contains('wain-hide-reconnect')) {
+                    el.classList.add('wain-hide-reconnect');
+                }
+            }
+            function tagHidden(node) {
+                if (node.nodeType !== 1) return;
+                tagOne(node);
+                // Subtrees built off-document (e.g. a component mount) arrive as one node
+                if (node.firstElementChild) node.querySelectorAll(HIDE_SELECTOR).forEach(tagOne);
+            }
+            // The script runs from <head>, before <body> exists, so watching the root
+            // element from here sees every element. Vue rewrites className when it
+            // patches a class binding, which drops the tag; class changes re-tag.
+            new MutationObserver(function(records) {
+                for (const r of records) {
+                    if (r.type === 'attributes') tagOne(r.target);
+                    else r.addedNodes.forEach(tagHidden);
+                }
+            }).observe(document.documentElement, {childList: true, subtree: true, attributes: true, attributeFilter: ['class']});
+        })();
     </script>''')
     
-    with ui.header().classes('items-center justify-between px-4 md:px-6 py-3 bg-zinc-900'):
+    with ui.header().classes('wain-root items-center justify-between px-4 md:px-6 py-3 bg-zinc-900'):
         with ui.row().classes('items-center gap-4'):
-            wain_logo = AVAILABLE_LOGOS.get('wain')
             if wain_logo:
                 ui.image(f'/logos/{wain_logo}?{ASSET_VERSION}').classes('w-10 h-10 object-contain rounded-lg')
             else:
@@ -184,7 +360,7 @@ def main_page():
             ui.button('Settings', icon='settings', on_click=show_settings_dialog).props('flat').classes('header-btn text-zinc-400')
             ui.button('Add Job', icon='add', on_click=show_add_job_dialog).props('flat').classes('header-btn-primary')
     
-    with ui.column().classes('responsive-container gap-4'):
+    with ui.column().classes('wain-root responsive-container gap-4'):
         @ui.refreshable
         def stats_section():
             with ui.row().classes('w-full gap-4 flex-wrap'):
@@ -193,15 +369,16 @@ def main_page():
                 with ui.card().classes('stat-card'): create_stat_card('Completed', 'completed', 'check_circle', 'green')
                 with ui.card().classes('stat-card'): create_stat_card('Failed', 'failed', 'error', 'red')
         
-        render_app.stats_container = stats_section
+        # Containers are refreshed from many places; bursts collapse into one rebuild
+        render_app.stats_container = DebouncedRefresh(stats_section)
         stats_section()
         
         with ui.row().classes('w-full items-center justify-between'):
             ui.label('Render Queue').classes('text-xl font-bold')
             @ui.refreshable
             def job_count():
-                ui.label(f'{len(render_app.jobs)} jobs').classes('text-gray-400')
-            render_app.job_count_container = job_count
+                ui.label(_job_count_label(len(render_app.jobs))).classes('text-gray-400')
+            render_app.job_count_container = DebouncedRefresh(job_count)
             job_count()
         
         @ui.refreshable
@@ -216,7 +393,7 @@ def main_page():
                 for job in render_app.jobs:
                     create_job_card(job)
         
-        render_app.queue_container = queue_list
+        render_app.queue_container = DebouncedRefresh(queue_list)
         queue_list()
         
         with ui.expansion('Log', icon='terminal').classes('w-full log-expansion'):
@@ -224,7 +401,7 @@ def main_page():
                 ui.label('Render Log').classes('text-sm text-gray-400')
                 with ui.row().classes('gap-2'):
                     def save_log_to_file():
-                        log_text = '\n'.join(render_app.log_messages[-500:])
+                        log_text = '\n'.join(render_app.log_messages)
                         log_path = os.path.join(os.getcwd(), 'wain_render_log.txt')
                         try:
                             with open(log_path, 'w', encoding='utf-8') as f:
@@ -244,17 +421,23 @@ def main_page():
                     ui.button('Save Log to File', icon='save', on_click=save_log_to_file).props('flat dense').classes('text-zinc-300')
                     ui.button(icon='delete_sweep', on_click=clear_log).props('flat dense size=sm').classes('text-zinc-500').tooltip('Clear')
             
-            @ui.refreshable
-            def log_display():
-                with ui.scroll_area().classes('w-full h-48 bg-zinc-900 rounded border border-zinc-700'):
-                    with ui.column().classes('p-2 gap-0 font-mono text-xs w-full'):
-                        for msg in render_app.log_messages[-100:]:
-                            ui.label(msg).classes('text-gray-400 select-all cursor-text whitespace-pre-wrap break-all')
+            # The browser keeps the lines and only puts the visible ones in the DOM
+            log_view = ui.html(
+                '<div id="wain-log" class="w-full h-48 bg-zinc-900 rounded border border-zinc-700 p-2 font-mono text-xs">'
+                '<div class="wain-log-lines"></div></div>',
+                sanitize=False,
+            ).classes('w-full')
+            
+            def push_log():
+                messages = render_app.log_messages
+                lines = json.dumps(list(islice(messages, max(0, len(messages) - 100), None)))
+                log_view.client.run_javascript(f'window.wainSetLog && window.wainSetLog({lines})')
             
-            render_app.log_container = log_display
-            log_display()
+            render_app.log_container = DebouncedRefresh(push_log)
+            push_log()
     
-    ui.timer(0.25, render_app.process_queue)
+    render_app.resync_client()
+    render_app.queue_timer = ui.timer(render_app.QUEUE_INTERVAL_ACTIVE, render_app.process_queue)
     
     render_app.log(f"Wain v{APP_VERSION} started")
     
@@ -7,10 +7,13 @@ Helper functions for file dialogs, dependency management, etc.
 
 from wain.utils.bootstrap import check_and_install_dependencies, check_native_mode_available
 from wain.utils.file_dialogs import open_file_dialog_async, open_folder_dialog_async
+from wain.utils.debounce import Debouncer, DebouncedRefresh
 
 __all__ = [
     'check_and_install_dependencies',
     'check_native_mode_available',
     'open_file_dialog_async',
     'open_folder_dialog_async',
+    'Debouncer',
+    'DebouncedRefresh',
 ]
@@ -5,8 +5,10 @@ Wain Bootstrap
 Automatic dependency checking and installation.
 """
 
+import importlib
 import subprocess
 import sys
+from importlib.util import find_spec
 
 REQUIRED_PACKAGES = [
     ('nicegui', 'nicegui', True),
@@ -19,42 +21,60 @@ REQUIRED_PACKAGES = [
 ]
 
 
+def _is_installed(import_name: str) -> bool:
+    # find_spec locates the module without running it; for a dotted name it
+    # imports the parent package and raises if that is missing
+    try:
+        return find_spec(import_name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def _missing_packages():
+    """(import_name, pip_name, required) for every package that can't be found."""
+    return [pkg for pkg in REQUIRED_PACKAGES if not _is_installed(pkg[0])]
+
+
+def _pip_install(*args) -> bool:
+    try:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', *args], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
 def check_and_install_dependencies():
-    missing_required = []
-    missing_optional = []
-    
-    for import_name, pip_name, required in REQUIRED_PACKAGES:
-        try:
-            __import__(import_name)
-        except ImportError:
-            if required:
-                missing_required.append(pip_name)
-            else:
-                missing_optional.append(pip_name)
-    
-    all_missing = missing_required + missing_optional
+    missing = _missing_packages()
     
-    if all_missing:
+    if missing:
+        all_missing = [pip_name for _, pip_name, _ in missing]
         print("=" * 60)
         print("Wain - First Run Setup")
         print("=" * 60)
         print(f"\nInstalling packages: {', '.join(all_missing)}")
         
-        failed_required = []
+        # One pip run resolves everything together; pywebview on 3.13+ needs
+        # --no-deps plus its pure-Python deps, so it gets its own runs
+        batch = list(all_missing)
+        if 'pywebview' in batch and sys.version_info >= (3, 13):
+            batch.remove('pywebview')
+            if _pip_install('pywebview', '--no-deps'):
+                _pip_install('proxy-tools', 'bottle')
+        if batch and not _pip_install(*batch):
+            # One bad package fails the whole run; fall back to installing one by one
+            for package in batch:
+                _pip_install(package)
         
-        for package in all_missing:
-            print(f"  Installing {package}...")
-            try:
-                if package == 'pywebview' and sys.version_info >= (3, 13):
-                    subprocess.check_call([sys.executable, '-m', 'pip', 'install', package, '--no-deps'], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-                    subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'proxy-tools', 'bottle'], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-                else:
-                    subprocess.check_call([sys.executable, '-m', 'pip', 'install', package], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-                print(f"  [OK] {package}")
-            except subprocess.CalledProcessError:
-                if package in missing_required:
-                    failed_required.append(package)
-                    print(f"  [X] Failed: {package}")
+        # pip's exit code covers the whole batch; look each package up again
+        importlib.invalidate_caches()
+        still_missing = {pip_name for _, pip_name, _ in _missing_packages()}
+        failed_required = []
+        for _, pip_name, required in missing:
+            if pip_name not in still_missing:
+                print(f"  [OK] {pip_name}")
+            elif required:
+                failed_required.append(pip_name)
+                print(f"  [X] Failed: {pip_name}")
         
         if failed_required:
             print(f"\n[X] Failed: {', '.join(failed_required)}")
@@ -63,7 +83,15 @@ def check_and_install_dependencies():
         print("\nSetup complete!")
 
 
+# Result of the first native-mode check; the Qt imports are slow and the answer can't change
+_native_mode_available = None
+
+
 def check_native_mode_available() -> bool:
+    global _native_mode_available
+    if _native_mode_available is not None:
+        return _native_mode_available
+    
     import os
     try:
         os.environ['QT_API'] = 'pyqt6'
@@ -72,6 +100,7 @@ def check_native_mode_available() -> bool:
         from PyQt6 import QtWebEngineWidgets
         import qtpy
         import webview
-        return True
+        _native_mode_available = True
     except ImportError:
-        return False
+        _native_mode_available = False
+    return _native_mode_available
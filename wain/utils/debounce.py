@@ -0,0 +1,67 @@
+"""
+Wain Debounce
+=============
+
+Collapse bursts of calls into a single deferred call on the event loop.
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+
+class Debouncer:
+    """Runs a callback once, `delay` seconds after the last schedule() call."""
+
+    def __init__(self, callback: Callable[[], None], delay: float = 0.1):
+        self.callback = callback
+        self.delay = delay
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def pending(self) -> bool:
+        return self._handle is not None
+
+    def schedule(self):
+        """(Re)start the delay; the callback runs once the calls stop."""
+        if self._handle is not None:
+            self._handle.cancel()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop in this thread - nothing to coalesce with
+            self._handle = None
+            self.callback()
+            return
+        self._handle = loop.call_later(self.delay, self._fire)
+
+    def flush(self):
+        """Run a pending callback now instead of waiting for the delay."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._fire()
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _fire(self):
+        self._handle = None
+        self.callback()
+
+
+class DebouncedRefresh:
+    """Stands in for a ui.refreshable; refresh() calls within `delay` collapse into one.
+
+    `target` is a refreshable or a plain callable that redraws the view.
+    """
+
+    def __init__(self, target, delay: float = 0.08):
+        self.target = target
+        self._debouncer = Debouncer(getattr(target, 'refresh', target), delay)
+
+    def refresh(self):
+        self._debouncer.schedule()
+
+    def flush(self):
+        self._debouncer.flush()
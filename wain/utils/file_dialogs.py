@@ -8,150 +8,167 @@ Async file and folder dialog helpers.
 import os
 import sys
 import json
+import queue
+import asyncio
 import subprocess
 import threading
 from typing import List, Optional, Callable
 
 from nicegui import ui
 
-_pending_file_results = {}
-_result_counter = 0
-_result_lock = threading.Lock()
-
-
-def _run_file_dialog_subprocess(title: str, filetypes: list, initial_dir: str) -> Optional[str]:
-    script = '''
+# Long-lived Tk process: interpreter and Tk start once, then each request is a
+# JSON line on stdin answered by a JSON line on stdout
+_HELPER_SCRIPT = '''
 import tkinter as tk
 from tkinter import filedialog
 import sys
 import json
 
-args = json.loads(sys.argv[1])
 root = tk.Tk()
 root.withdraw()
-root.attributes('-topmost', True)
-root.lift()
-root.update()
 
-tk_filetypes = [(name, pattern) for name, pattern in args.get('filetypes', [])]
-tk_filetypes.append(('All Files', '*.*'))
-
-result = filedialog.askopenfilename(
-    title=args.get('title', 'Select File'),
-    filetypes=tk_filetypes,
-    initialdir=args.get('initial_dir', '') or None
-)
-
-print(result if result else '')
-root.destroy()
-'''
+for line in sys.stdin:
+    args = json.loads(line)
+    root.attributes('-topmost', True)
+    root.lift()
+    root.update()
     
-    args = {'title': title, 'filetypes': filetypes or [], 'initial_dir': initial_dir or ''}
+    if args.get('kind') == 'folder':
+        result = filedialog.askdirectory(parent=root, title=args.get('title', 'Select Folder'), initialdir=args.get('initial_dir', '') or None)
+    else:
+        tk_filetypes = [(name, pattern) for name, pattern in args.get('filetypes', [])]
+        tk_filetypes.append(('All Files', '*.*'))
+        result = filedialog.askopenfilename(
+            parent=root,
+            title=args.get('title', 'Select File'),
+            filetypes=tk_filetypes,
+            initialdir=args.get('initial_dir', '') or None
+        )
     
-    try:
-        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        proc = subprocess.Popen([sys.executable, '-c', script, json.dumps(args)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=creation_flags)
-        stdout, _ = proc.communicate(timeout=300)
-        path = stdout.decode('utf-8').strip()
-        if path and os.path.exists(path):
-            return path
-    except:
-        pass
-    return None
+    root.update()
+    sys.stdout.write(json.dumps({'result': result or ''}) + '\\n')
+    sys.stdout.flush()
+'''
 
+# A dialog left open longer than this is given up on and the helper restarted
+_DIALOG_TIMEOUT = 300
 
-def _run_folder_dialog_subprocess(title: str, initial_dir: str) -> Optional[str]:
-    script = '''
-import tkinter as tk
-from tkinter import filedialog
-import sys
-import json
+_helper_proc: Optional[subprocess.Popen] = None
+# Lines the helper prints, read on a thread of their own so waits can time out;
+# '' marks the end of its output
+_helper_replies: Optional[queue.Queue] = None
+# Dialogs are requested from worker threads; one request at a time goes to the helper
+_helper_lock = threading.Lock()
 
-args = json.loads(sys.argv[1])
-root = tk.Tk()
-root.withdraw()
-root.attributes('-topmost', True)
-root.lift()
-root.update()
 
-result = filedialog.askdirectory(title=args.get('title', 'Select Folder'), initialdir=args.get('initial_dir', '') or None)
-print(result if result else '')
-root.destroy()
-'''
-    
-    args = {'title': title, 'initial_dir': initial_dir or ''}
-    
+def _read_replies(proc: subprocess.Popen, replies: queue.Queue):
     try:
-        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        proc = subprocess.Popen([sys.executable, '-c', script, json.dumps(args)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=creation_flags)
-        stdout, _ = proc.communicate(timeout=300)
-        path = stdout.decode('utf-8').strip()
-        if path and os.path.isdir(path):
-            return path
-    except:
+        for line in proc.stdout:
+            replies.put(line)
+    except (OSError, ValueError):
         pass
+    replies.put('')
+
+
+def _get_helper() -> subprocess.Popen:
+    global _helper_proc, _helper_replies
+    if _helper_proc is None or _helper_proc.poll() is not None:
+        creation_flags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        _helper_proc = subprocess.Popen(
+            [sys.executable, '-c', _HELPER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', bufsize=1, creationflags=creation_flags,
+        )
+        # A fresh queue per process, so nothing left from a dead helper is read as a reply
+        _helper_replies = queue.Queue()
+        threading.Thread(target=_read_replies, args=(_helper_proc, _helper_replies), daemon=True).start()
+    return _helper_proc
+
+
+def _stop_helper():
+    global _helper_proc
+    if _helper_proc is not None:
+        try:
+            _helper_proc.kill()
+        except Exception:
+            pass
+        _helper_proc = None
+
+
+def _ask_helper(request: dict) -> str:
+    with _helper_lock:
+        # A helper that died since the last dialog is restarted once. Only sending
+        # is retried: a delivered request may already have shown its dialog.
+        for _ in range(2):
+            try:
+                proc = _get_helper()
+                proc.stdin.write(json.dumps(request) + '\n')
+                proc.stdin.flush()
+                break
+            except (OSError, ValueError):
+                _stop_helper()
+        else:
+            return ''
+        
+        try:
+            line = _helper_replies.get(timeout=_DIALOG_TIMEOUT)
+            reply = json.loads(line) if line else None
+        except (queue.Empty, ValueError):
+            reply = None
+        if isinstance(reply, dict):
+            result = reply.get('result', '')
+            return result if isinstance(result, str) else ''
+        # Hung, dead or garbled helper: kill it so later dialogs get a fresh one
+        _stop_helper()
+    return ''
+
+
+def _run_file_dialog_subprocess(title: str, filetypes: list, initial_dir: str) -> Optional[str]:
+    path = _ask_helper({'kind': 'file', 'title': title, 'filetypes': filetypes or [], 'initial_dir': initial_dir or ''})
+    if path and os.path.exists(path):
+        return path
     return None
 
 
-def open_file_dialog_async(title: str, filetypes: List[tuple], initial_dir: str, callback: Callable[[Optional[str]], None]):
-    global _result_counter
-    
-    with _result_lock:
-        _result_counter += 1
-        result_id = _result_counter
-        _pending_file_results[result_id] = {'done': False, 'result': None, 'callback': callback}
+def _run_folder_dialog_subprocess(title: str, initial_dir: str) -> Optional[str]:
+    path = _ask_helper({'kind': 'folder', 'title': title, 'initial_dir': initial_dir or ''})
+    if path and os.path.isdir(path):
+        return path
+    return None
+
+
+def _run_in_background(func: Callable[[], Optional[str]], callback: Callable[[Optional[str]], None]):
+    """Run func on a worker thread and pass its result to callback on the event loop."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    # Run the callback in the caller's UI context, as the old polling timer did
+    parent = ui.context.slot.parent
     
     def run():
-        result = _run_file_dialog_subprocess(title, filetypes, initial_dir)
-        with _result_lock:
-            if result_id in _pending_file_results:
-                _pending_file_results[result_id]['result'] = result
-                _pending_file_results[result_id]['done'] = True
-    
-    threading.Thread(target=run, daemon=True).start()
+        # The future is always settled, so the callback never waits forever
+        try:
+            result = func()
+        except Exception as e:
+            loop.call_soon_threadsafe(future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(future.set_result, result)
     
-    def check_result():
-        with _result_lock:
-            if result_id in _pending_file_results:
-                entry = _pending_file_results[result_id]
-                if entry['done']:
-                    result = entry['result']
-                    cb = entry['callback']
-                    del _pending_file_results[result_id]
-                    cb(result)
-                    return
-        ui.timer(0.1, check_result, once=True)
+    def on_done(f):
+        if parent.is_deleted:
+            return
+        error = f.exception()
+        if error is not None:
+            print(f"[Wain] File dialog failed: {error}")
+        with parent:
+            callback(None if error is not None else f.result())
     
-    ui.timer(0.1, check_result, once=True)
+    future.add_done_callback(on_done)
+    threading.Thread(target=run, daemon=True).start()
+
+
+def open_file_dialog_async(title: str, filetypes: List[tuple], initial_dir: str, callback: Callable[[Optional[str]], None]):
+    _run_in_background(lambda: _run_file_dialog_subprocess(title, filetypes, initial_dir), callback)
 
 
 def open_folder_dialog_async(title: str, initial_dir: str, callback: Callable[[Optional[str]], None]):
-    global _result_counter
-    
-    with _result_lock:
-        _result_counter += 1
-        result_id = _result_counter
-        _pending_file_results[result_id] = {'done': False, 'result': None, 'callback': callback}
-    
-    def run():
-        result = _run_folder_dialog_subprocess(title, initial_dir)
-        with _result_lock:
-            if result_id in _pending_file_results:
-                _pending_file_results[result_id]['result'] = result
-                _pending_file_results[result_id]['done'] = True
-    
-    threading.Thread(target=run, daemon=True).start()
-    
-    def check_result():
-        with _result_lock:
-            if result_id in _pending_file_results:
-                entry = _pending_file_results[result_id]
-                if entry['done']:
-                    result = entry['result']
-                    cb = entry['callback']
-                    del _pending_file_results[result_id]
-                    cb(result)
-                    return
-        ui.timer(0.1, check_result, once=True)
-    
-    ui.timer(0.1, check_result, once=True)
+    _run_in_background(lambda: _run_folder_dialog_subprocess(title, initial_dir), callback)